@@ -1,10 +1,19 @@
 # api_server.py
-from fastapi import FastAPI
+import asyncio
+import gzip
+import logging
+import numpy as np
+import orjson
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
 from fear_greed_index import CNNFearAndGreedIndex
+from fear_greed_index.signals import classify_signal
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="Fear & Greed Index API",
@@ -20,7 +29,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Response models
+# Response models. These only describe the OpenAPI schema: bodies are built as
+# plain dicts and encoded once per refresh, so no model is constructed per request.
 class IndicatorResponse(BaseModel):
     name: str
     score: float
@@ -43,98 +53,237 @@ class TradingSignalResponse(BaseModel):
     signal: str
     recommendation: str
 
-# Cache the data (refresh every 5 minutes in production)
-_cache = {"data": None, "timestamp": None}
-
-def get_fgi():
-    """Get Fear & Greed data with simple caching."""
-    now = datetime.now()
-    if (_cache["data"] is None or
-        _cache["timestamp"] is None or
-        (now - _cache["timestamp"]).total_seconds() > 300):
-        _cache["data"] = CNNFearAndGreedIndex()
-        _cache["timestamp"] = now
+# Cache the data (refresh every 5 minutes in production). Response bodies are
+# serialized once per refresh so the handlers only copy bytes to the socket.
+# Stale data keeps being served while a background task fetches the update.
+_cache = {
+    "data": None,
+    "timestamp": None,
+    "refreshing": False,
+    "refresh_task": None,
+    "etag": "",
+    "json_full": b"",
+    "json_score": b"",
+    "json_signal": b"",
+    "json_indicators": [],
+    "indicator_index": {},
+    "historical": [],
+    "json_historical": {},
+    "gzip": {},
+}
+
+_CACHE_TTL = 300
+_DEFAULT_HISTORICAL_LIMIT = 30
+# Common /historical limits whose bodies are pre-serialized on refresh.
+_HISTORICAL_LIMITS = (7, 14, 30, 90, 365)
+# Bodies smaller than this are not worth compressing.
+_GZIP_MIN_SIZE = 1024
+_refresh_lock = asyncio.Lock()
+
+def _normalize_indicator_name(name: str) -> str:
+    """Normalize an indicator name or alias for lookup."""
+    return name.lower().replace("_", " ").replace("-", " ")
+
+def _build_payloads(fgi: CNNFearAndGreedIndex) -> dict:
+    """Pre-serialize every endpoint's response body for one cache refresh."""
+    indicators = [
+        {
+            "name": ind.name,
+            "score": ind.score,
+            "rating": ind.rating,
+            "timestamp": ind.timestamp
+        }
+        for ind in fgi.all_indicators
+    ]
+    json_indicators = [
+        (_normalize_indicator_name(ind["name"]), orjson.dumps(ind)) for ind in indicators
+    ]
+    # Exact-match aliases: display name and API key, e.g. "market volatility (vix)"
+    # and "market volatility vix" (from /indicator/market_volatility_vix).
+    api_keys = {name: key for key, name in CNNFearAndGreedIndex._INDICATOR_MAP.items()}
+    indicator_index = {}
+    for ind, (ind_name, body) in zip(indicators, json_indicators):
+        indicator_index[ind_name] = body
+        if ind["name"] in api_keys:
+            indicator_index[_normalize_indicator_name(api_keys[ind["name"]])] = body
+    signal = classify_signal(fgi.score)
+    x, y, ratings = fgi.get_historical_arrays()
+    # Convert every epoch-ms timestamp in one NumPy pass. The strings carry an
+    # explicit "Z" so they are not mistaken for the naive local indicator times.
+    dates = np.datetime_as_string(
+        x.astype("datetime64[ms]"), unit="s", timezone="UTC"
+    ).tolist()
+    historical = [
+        {
+            "date": date,
+            "score": score,
+            "rating": rating
+        }
+        for date, score, rating in zip(dates, y.tolist(), ratings.tolist())
+    ]
+    payloads = {
+        "json_full": orjson.dumps({
+            "score": fgi.score,
+            "rating": fgi.rating,
+            "previous_close": fgi.previous_close,
+            "previous_1_week": fgi.previous_1_week,
+            "previous_1_month": fgi.previous_1_month,
+            "previous_1_year": fgi.previous_1_year,
+            "timestamp": fgi.timestamp,
+            "indicators": indicators,
+        }),
+        "json_score": orjson.dumps({"score": fgi.score, "rating": fgi.rating}),
+        "json_signal": orjson.dumps({
+            "score": fgi.score,
+            "rating": fgi.rating,
+            "signal": signal.name.replace(" ", "_"),
+            "recommendation": signal.recommendation,
+        }),
+        "json_indicators": json_indicators,
+        "indicator_index": indicator_index,
+        "historical": historical,
+        "json_historical": {
+            limit: orjson.dumps(historical[-limit:]) for limit in _HISTORICAL_LIMITS
+        },
+    }
+    # Compress the large bodies once here rather than on every request; keyed
+    # by the body itself so _json can find the compressed form of any of them.
+    payloads["gzip"] = {
+        body: gzip.compress(body, compresslevel=9)
+        for body in (payloads["json_full"], *payloads["json_historical"].values())
+        if len(body) >= _GZIP_MIN_SIZE
+    }
+    return payloads
+
+async def _refresh():
+    """Fetch fresh data without blocking the event loop and swap in the new payloads."""
+    try:
+        # The server keeps its own cache; always fetch from CNN on refresh.
+        fgi = await CNNFearAndGreedIndex.create(ttl=0)
+        # Encoding the full payload set (including history) runs in a worker
+        # thread so the event loop keeps accepting connections meanwhile.
+        payloads = await asyncio.to_thread(_build_payloads, fgi)
+        now = datetime.now()
+        _cache.update(payloads, data=fgi, timestamp=now, etag=f'"{now.timestamp():.6f}"')
+    finally:
+        _cache["refreshing"] = False
+
+async def _refresh_in_background():
+    """Refresh the cache, keeping the stale payloads if CNN is unreachable."""
+    try:
+        await _refresh()
+    except Exception:
+        logger.exception("Fear & Greed cache refresh failed; serving stale data")
+
+async def get_fgi():
+    """Get Fear & Greed data with simple caching.
+
+    Only the very first request waits for CNN; once data is cached, an expired
+    entry is returned as-is while a background task refreshes it.
+    """
+    if _cache["data"] is None:
+        async with _refresh_lock:
+            if _cache["data"] is None:
+                _cache["refreshing"] = True
+                await _refresh()
+    elif (not _cache["refreshing"] and
+          (datetime.now() - _cache["timestamp"]).total_seconds() > _CACHE_TTL):
+        _cache["refreshing"] = True
+        # Keep a reference so the task is not garbage-collected mid-flight.
+        _cache["refresh_task"] = asyncio.create_task(_refresh_in_background())
     return _cache["data"]
 
-@app.get("/", response_model=FearGreedResponse)
-async def get_fear_greed():
+def _json(request: Request, body: bytes) -> Response:
+    """Wrap pre-serialized JSON bytes in a response with HTTP cache validators.
+
+    Clients and proxies may reuse the body until the cache entry expires; a
+    revalidation carrying the current ETag gets an empty 304 instead. Large
+    bodies are sent gzip-compressed to clients that accept it.
+    """
+    etag = _cache["etag"]
+    compressed = None
+    if len(body) >= _GZIP_MIN_SIZE and "gzip" in request.headers.get("accept-encoding", ""):
+        compressed = _cache["gzip"].get(body) or gzip.compress(body)
+        etag = etag[:-1] + '-gzip"'
+    age = (datetime.now() - _cache["timestamp"]).total_seconds()
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max(0, int(_CACHE_TTL - age))}",
+        "Vary": "Accept-Encoding",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if compressed is not None:
+        headers["Content-Encoding"] = "gzip"
+        body = compressed
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# Handlers return pre-serialized bytes from the cache.
+@app.get("/", response_class=ORJSONResponse, responses={200: {"model": FearGreedResponse}})
+async def get_fear_greed(request: Request):
     """Get current Fear & Greed Index with all indicators."""
-    fgi = get_fgi()
-    return FearGreedResponse(
-        score=fgi.score,
-        rating=fgi.rating,
-        previous_close=fgi.previous_close,
-        previous_1_week=fgi.previous_1_week,
-        previous_1_month=fgi.previous_1_month,
-        previous_1_year=fgi.previous_1_year,
-        timestamp=fgi.timestamp,
-        indicators=[
-            IndicatorResponse(
-                name=ind.name,
-                score=ind.score,
-                rating=ind.rating,
-                timestamp=ind.timestamp
-            )
-            for ind in fgi.all_indicators
-        ]
-    )
+    await get_fgi()
+    return _json(request, _cache["json_full"])
 
-@app.get("/score")
-async def get_score():
+@app.get("/score", response_class=ORJSONResponse)
+async def get_score(request: Request):
     """Get just the current score and rating."""
-    fgi = get_fgi()
-    return {"score": fgi.score, "rating": fgi.rating}
+    await get_fgi()
+    return _json(request, _cache["json_score"])
 
-@app.get("/signal", response_model=TradingSignalResponse)
-async def get_trading_signal():
+@app.get("/signal", response_class=ORJSONResponse, responses={200: {"model": TradingSignalResponse}})
+async def get_trading_signal(request: Request):
     """Get a trading signal based on current sentiment."""
-    fgi = get_fgi()
-
-    if fgi.score < 20:
-        signal, recommendation = "STRONG_BUY", "Extreme fear - potential buying opportunity"
-    elif fgi.score < 40:
-        signal, recommendation = "BUY", "Fear in market - consider accumulating"
-    elif fgi.score < 60:
-        signal, recommendation = "HOLD", "Neutral sentiment - maintain positions"
-    elif fgi.score < 80:
-        signal, recommendation = "SELL", "Greed in market - consider taking profits"
-    else:
-        signal, recommendation = "STRONG_SELL", "Extreme greed - potential market top"
-
-    return TradingSignalResponse(
-        score=fgi.score,
-        rating=fgi.rating,
-        signal=signal,
-        recommendation=recommendation
-    )
+    await get_fgi()
+    return _json(request, _cache["json_signal"])
 
-@app.get("/indicator/{name}")
-async def get_indicator(name: str):
+@app.get("/indicator/{name}", response_class=ORJSONResponse)
+async def get_indicator(request: Request, name: str):
     """Get a specific indicator by name."""
-    fgi = get_fgi()
-    name_lower = name.lower().replace("_", " ").replace("-", " ")
-
-    for ind in fgi.all_indicators:
-        if name_lower in ind.name.lower():
-            return {
-                "name": ind.name,
-                "score": ind.score,
-                "rating": ind.rating,
-                "timestamp": ind.timestamp
-            }
-
-    return {"error": f"Indicator '{name}' not found"}
-
-@app.get("/historical")
-async def get_historical(limit: int = 30):
+    await get_fgi()
+    name_lower = _normalize_indicator_name(name)
+    indicator_index = _cache["indicator_index"]
+
+    body = indicator_index.get(name_lower)
+    if body is not None:
+        return _json(request, body)
+
+    # Partial names such as "vix" or "momentum" fall back to a substring scan;
+    # a hit is remembered so the next request is a dict lookup.
+    for ind_name, body in _cache["json_indicators"]:
+        if name_lower in ind_name:
+            indicator_index[name_lower] = body
+            return _json(request, body)
+
+    return ORJSONResponse({"error": f"Indicator '{name}' not found"})
+
+@app.get("/historical", response_class=ORJSONResponse)
+async def get_historical(request: Request, limit: int = _DEFAULT_HISTORICAL_LIMIT):
     """Get historical data (default last 30 days)."""
-    fgi = get_fgi()
-    historical = fgi.get_historical_data()[-limit:]
-    return [
-        {
-            "date": datetime.fromtimestamp(d["x"] / 1000).isoformat(),
-            "score": d["y"],
-            "rating": d["rating"]
-        }
-        for d in historical
-    ]
+    await get_fgi()
+    body = _cache["json_historical"].get(limit)
+    if body is not None:
+        return _json(request, body)
+    return _json(request, orjson.dumps(_cache["historical"][-limit:]))
+
+def main():
+    """Run the API under uvicorn, one worker per CPU core by default.
+
+    Set ``FGI_API_WORKERS``, ``FGI_API_HOST`` and ``FGI_API_PORT`` to override.
+    With ``uvicorn[standard]`` installed, uvicorn picks uvloop and httptools
+    automatically. Each worker keeps its own cache, and all handlers are
+    non-blocking, so workers scale with cores.
+    """
+    import os
+    import uvicorn
+
+    uvicorn.run(
+        "api_server:app",
+        host=os.environ.get("FGI_API_HOST", "127.0.0.1"),
+        port=int(os.environ.get("FGI_API_PORT", "8000")),
+        workers=int(os.environ.get("FGI_API_WORKERS", os.cpu_count() or 1)),
+        access_log=False,
+    )
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,10 @@
 """CNN Fear & Greed Index Dashboard"""
 
+import numpy as np
 import streamlit as st
 import plotly.graph_objects as go
-from datetime import datetime
 from fear_greed_index import CNNFearAndGreedIndex
+from fear_greed_index.zones import zone_index, zone_indices
 
 st.set_page_config(
     page_title="CNN Fear & Greed Index",
@@ -12,18 +13,18 @@ st.set_page_config(
 )
 
 
+# Most points the historical chart sends to the browser; longer series are
+# downsampled with LTTB, which keeps the visual shape of the line.
+MAX_CHART_POINTS = 500
+
+# Zone colors, extreme fear -> extreme greed
+_ZONE_COLORS = ("#8B0000", "#FF4500", "#FFD700", "#32CD32", "#006400")
+_ZONE_COLOR_ARRAY = np.array(_ZONE_COLORS)
+
+
 def get_color_for_score(score: float) -> str:
     """Return color based on fear/greed score"""
-    if score < 25:
-        return "#8B0000"  # Extreme Fear - dark red
-    elif score < 45:
-        return "#FF4500"  # Fear - orange red
-    elif score < 55:
-        return "#FFD700"  # Neutral - gold
-    elif score < 75:
-        return "#32CD32"  # Greed - lime green
-    else:
-        return "#006400"  # Extreme Greed - dark green
+    return _ZONE_COLORS[zone_index(score)]
 
 
 def create_gauge(score: float, title: str = "Fear & Greed Index") -> go.Figure:
@@ -58,10 +59,43 @@ def create_gauge(score: float, title: str = "Fear & Greed Index") -> go.Figure:
     return fig
 
 
-def create_historical_chart(data: list, title: str = "Fear & Greed Index History") -> go.Figure:
-    """Create historical line chart"""
-    dates = [datetime.fromtimestamp(d["x"] / 1000) for d in data]
-    values = [d["y"] for d in data]
+def downsample_lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Return indices of the points kept by Largest-Triangle-Three-Buckets"""
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # First and last points are always kept; the rest are split into buckets
+    # and each bucket keeps the point forming the largest triangle with the
+    # previously kept point and the average of the next bucket.
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    keep = np.empty(threshold, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def create_historical_chart(x: np.ndarray, y: np.ndarray,
+                            title: str = "Fear & Greed Index History") -> go.Figure:
+    """Create historical line chart from epoch-ms timestamps and scores
+
+    Takes the columns of ``get_historical_arrays()``, so no per-point
+    conversion of the historical data is needed.
+    """
+    keep = downsample_lttb(x, y, MAX_CHART_POINTS)
+
+    # Epoch milliseconds -> datetime64 in one cast; Plotly serializes the
+    # arrays directly instead of iterating Python datetime objects.
+    dates = x[keep].astype("datetime64[ms]")
+    values = y[keep]
 
     fig = go.Figure()
 
@@ -73,14 +107,14 @@ def create_historical_chart(data: list, title: str = "Fear & Greed Index History
     fig.add_hrect(y0=75, y1=100, fillcolor="rgba(0, 100, 0, 0.1)", line_width=0)
 
     # Color each segment based on value
-    colors = [get_color_for_score(v) for v in values]
+    colors = _ZONE_COLOR_ARRAY[zone_indices(values)]
 
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=dates,
         y=values,
         mode='lines',
         line=dict(width=2),
-        marker=dict(color=colors),
+        marker=dict(color=colors.tolist()),
         hovertemplate='<b>Date:</b> %{x|%b %d, %Y}<br><b>Score:</b> %{y:.1f}<extra></extra>'
     ))
 
@@ -124,10 +158,28 @@ def create_indicators_chart(indicators: list) -> go.Figure:
     return fig
 
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+# The index and its figures are read-only once built, so they are cached by
+# reference with cache_resource instead of being pickled on every rerun.
+@st.cache_resource(ttl=300)  # Cache for 5 minutes
 def load_data():
     """Load Fear & Greed data with caching"""
-    return CNNFearAndGreedIndex()
+    # Streamlit caches the result itself, so bypass the on-disk response cache.
+    return CNNFearAndGreedIndex(ttl=0)
+
+
+def _fgi_cache_key(cnn_fg: CNNFearAndGreedIndex) -> tuple:
+    """Identify a data snapshot without hashing its historical data"""
+    return (cnn_fg.timestamp, cnn_fg.score)
+
+
+@st.cache_resource(ttl=300, hash_funcs={CNNFearAndGreedIndex: _fgi_cache_key})
+def build_figures(cnn_fg: CNNFearAndGreedIndex) -> tuple:
+    """Build the gauge, historical and indicators figures once per data snapshot"""
+    fig_gauge = create_gauge(cnn_fg.score, f"{cnn_fg.rating.title()}")
+    x, y, _ = cnn_fg.get_historical_arrays()
+    fig_history = create_historical_chart(x, y) if len(x) else None
+    fig_indicators = create_indicators_chart(cnn_fg.all_indicators)
+    return fig_gauge, fig_history, fig_indicators
 
 
 def main():
@@ -137,12 +189,12 @@ def main():
     # Load data
     with st.spinner("Loading market data..."):
         cnn_fg = load_data()
+        fig_gauge, fig_history, fig_indicators = build_figures(cnn_fg)
 
     # Top row - Main gauge and summary
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        fig_gauge = create_gauge(cnn_fg.score, f"{cnn_fg.rating.title()}")
         st.plotly_chart(fig_gauge, width="stretch")
 
     with col2:
@@ -171,8 +223,7 @@ def main():
 
     # Historical chart
     st.markdown("### Historical Trend")
-    if cnn_fg.historical_data:
-        fig_history = create_historical_chart(cnn_fg.historical_data)
+    if fig_history is not None:
         st.plotly_chart(fig_history, width="stretch")
 
     st.divider()
@@ -183,7 +234,6 @@ def main():
     col1, col2 = st.columns([2, 1])
 
     with col1:
-        fig_indicators = create_indicators_chart(cnn_fg.all_indicators)
         st.plotly_chart(fig_indicators, width="stretch")
 
     with col2:
@@ -209,7 +259,7 @@ def main():
 
     # Refresh button
     if st.button("🔄 Refresh Data"):
-        st.cache_data.clear()
+        st.cache_resource.clear()
         st.rerun()
 
 
@@ -2,12 +2,19 @@
 __docformat__ = "numpy"
 
 from datetime import datetime
-from typing import Optional
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.colors import LinearSegmentedColormap
+from typing import TYPE_CHECKING, Optional
+import numpy as np
 from fear_greed_index import scrape_cnn
-from fear_greed_index.FearAndGreedIndicator import FearAndGreedIndicator
+from fear_greed_index.FearAndGreedIndicator import FearAndGreedIndicator, _historical_columns
+from fear_greed_index.zones import zone_indices
+
+# matplotlib is only imported by the plot methods: it dominates import time
+# and most users (CLI, API, MCP server) never plot.
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+# Indicator bar colors per sentiment zone, extreme fear -> extreme greed
+_ZONE_BAR_COLORS = np.array(["#8B0000", "#FF4500", "#FFD700", "#90EE90", "#006400"])
 
 
 class CNNFearAndGreedIndex:
@@ -45,6 +52,27 @@ class CNNFearAndGreedIndex:
         Safe Haven Demand indicator
     """
 
+    __slots__ = (
+        "score",
+        "rating",
+        "previous_close",
+        "previous_1_week",
+        "previous_1_month",
+        "previous_1_year",
+        "timestamp",
+        "historical_data",
+        "junk_bond_demand",
+        "market_volatility",
+        "put_call_options",
+        "market_momentum",
+        "stock_price_strength",
+        "stock_price_breadth",
+        "safe_haven_demand",
+        "_all_indicators",
+        "_historical_arrays",
+        "_data",
+    )
+
     # Mapping from API keys to indicator names
     _INDICATOR_MAP = {
         "junk_bond_demand": "Junk Bond Demand",
@@ -56,8 +84,18 @@ class CNNFearAndGreedIndex:
         "safe_haven_demand": "Safe Haven Demand",
     }
 
-    def __init__(self):
-        """Constructor"""
+    def __init__(self, data: Optional[dict] = None, ttl: Optional[float] = None):
+        """Constructor
+
+        Parameters
+        ----------
+        data : dict, optional
+            CNN API response to load. If None, it is fetched from the API.
+        ttl : float, optional
+            Maximum age in seconds of a response reused from the on-disk cache
+            when fetching. If None, uses ``FGI_CACHE_TTL`` (default 600); 0
+            always fetches.
+        """
         self.score = 0.0
         self.rating = "N/A"
         self.previous_close = 0.0
@@ -66,6 +104,7 @@ class CNNFearAndGreedIndex:
         self.previous_1_year = 0.0
         self.timestamp = None
         self.historical_data = []
+        self._historical_arrays = None
 
         self.junk_bond_demand = None
         self.market_volatility = None
@@ -74,12 +113,50 @@ class CNNFearAndGreedIndex:
         self.stock_price_strength = None
         self.stock_price_breadth = None
         self.safe_haven_demand = None
+        self._all_indicators = ()
+        self._data = None
+
+        self._load_fear_and_greed(data, ttl)
 
-        self._load_fear_and_greed()
+    @classmethod
+    async def create(cls, ttl: Optional[float] = None) -> "CNNFearAndGreedIndex":
+        """Fetch the index asynchronously, without blocking the event loop
 
-    def _load_fear_and_greed(self):
+        Parameters
+        ----------
+        ttl : float, optional
+            Maximum age in seconds of a response reused from the on-disk cache.
+            If None, uses ``FGI_CACHE_TTL`` (default 600); 0 always fetches.
+
+        Returns
+        -------
+        CNNFearAndGreedIndex
+            Index loaded from the CNN API
+        """
+        return cls(await scrape_cnn._get_fear_greed_data_async(ttl))
+
+    def refresh(self, ttl: Optional[float] = None):
+        """Reload the index from the CNN API in place
+
+        The existing indicator objects are updated rather than replaced, and
+        nothing is reloaded when the API answers with the payload already
+        loaded (e.g. a 304 Not Modified).
+
+        Parameters
+        ----------
+        ttl : float, optional
+            Maximum age in seconds of a response reused from the on-disk cache.
+            If None, uses ``FGI_CACHE_TTL`` (default 600); 0 always fetches.
+        """
+        self._load_fear_and_greed(None, ttl)
+
+    def _load_fear_and_greed(self, data: Optional[dict] = None, ttl: Optional[float] = None):
         """Load Fear and Greed Index from CNN API"""
-        data = scrape_cnn._get_fear_greed_data()
+        if data is None:
+            data = scrape_cnn._get_fear_greed_data(ttl)
+        if data is self._data:
+            return
+        self._data = data
 
         # Load main index data
         fg_data = data.get("fear_and_greed", {})
@@ -90,15 +167,22 @@ class CNNFearAndGreedIndex:
         self.previous_1_month = fg_data.get("previous_1_month", 0.0)
         self.previous_1_year = fg_data.get("previous_1_year", 0.0)
 
+        # Assigned even when missing, so a refresh never keeps a stale value
         timestamp_str = fg_data.get("timestamp")
-        if timestamp_str:
-            self.timestamp = datetime.fromisoformat(timestamp_str.replace("+00:00", "+0000"))
+        self.timestamp = datetime.fromisoformat(timestamp_str) if timestamp_str else None
 
         # Load historical data
         fg_historical = data.get("fear_and_greed_historical", {})
         self.historical_data = fg_historical.get("data", [])
+        self._historical_arrays = None
+
+        # Load indicators, reusing the existing objects on refresh
+        # (_INDICATOR_MAP is in the same order as _all_indicators)
+        if self._all_indicators:
+            for indicator, key in zip(self._all_indicators, self._INDICATOR_MAP):
+                indicator._load_from_data(data.get(key) or {})
+            return
 
-        # Load indicators
         self.junk_bond_demand = FearAndGreedIndicator(
             self._INDICATOR_MAP["junk_bond_demand"],
             data.get("junk_bond_demand")
@@ -128,10 +212,7 @@ class CNNFearAndGreedIndex:
             data.get("safe_haven_demand")
         )
 
-    @property
-    def all_indicators(self) -> list:
-        """Get all indicators as a list"""
-        return [
+        self._all_indicators = (
             self.junk_bond_demand,
             self.market_volatility,
             self.put_call_options,
@@ -139,7 +220,12 @@ class CNNFearAndGreedIndex:
             self.stock_price_strength,
             self.stock_price_breadth,
             self.safe_haven_demand,
-        ]
+        )
+
+    @property
+    def all_indicators(self) -> tuple:
+        """Get all indicators as a tuple, built once when the data is loaded"""
+        return self._all_indicators
 
     def get_score(self) -> float:
         """Get current Fear and Greed Index score"""
@@ -201,7 +287,19 @@ class CNNFearAndGreedIndex:
         """Get historical Fear and Greed Index data"""
         return self.historical_data
 
-    def plot_fear_greed_index(self, ax: Optional[plt.Axes] = None) -> plt.Axes:
+    def get_historical_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get historical data as read-only NumPy columns, converted once and cached
+
+        Returns
+        -------
+        tuple of np.ndarray
+            Epoch-millisecond timestamps (int64), scores (float64) and ratings (object)
+        """
+        if self._historical_arrays is None:
+            self._historical_arrays = _historical_columns(self.historical_data)
+        return self._historical_arrays
+
+    def plot_fear_greed_index(self, ax: Optional["plt.Axes"] = None) -> "plt.Axes":
         """Plot Fear and Greed Index historical chart
 
         Parameters
@@ -214,6 +312,11 @@ class CNNFearAndGreedIndex:
         plt.Axes
             Matplotlib axes with the chart
         """
+        import matplotlib.pyplot as plt
+        import matplotlib.dates as mdates
+        from matplotlib.collections import LineCollection
+        from matplotlib.colors import LinearSegmentedColormap
+
         if ax is None:
             fig, ax = plt.subplots(figsize=(12, 6))
 
@@ -221,16 +324,18 @@ class CNNFearAndGreedIndex:
             return ax
 
         # Extract dates and values
-        dates = [datetime.fromtimestamp(d["x"] / 1000) for d in self.historical_data]
-        values = [d["y"] for d in self.historical_data]
+        timestamps, values, _ = self.get_historical_arrays()
+        dates = timestamps.astype("datetime64[ms]")
 
         # Create color gradient (red=fear, green=greed)
         cmap = LinearSegmentedColormap.from_list("fear_greed", ["#8B0000", "#FF4500", "#FFD700", "#90EE90", "#006400"])
 
-        # Plot with color based on value
-        for i in range(len(dates) - 1):
-            color = cmap(values[i] / 100)
-            ax.plot(dates[i:i+2], values[i:i+2], color=color, linewidth=2)  # type: ignore[arg-type]
+        # Plot with color based on value: one collection of line segments,
+        # each colored by the value at its start
+        xy = np.column_stack([mdates.date2num(dates), values])
+        segments = np.stack([xy[:-1], xy[1:]], axis=1)
+        ax.add_collection(LineCollection(segments, colors=cmap(values[:-1] / 100), linewidths=2))
+        ax.autoscale_view()
 
         # Add horizontal bands for sentiment zones
         ax.axhspan(0, 25, alpha=0.1, color='red', label='Extreme Fear')
@@ -251,45 +356,24 @@ class CNNFearAndGreedIndex:
 
         return ax
 
-    def plot_all_indicators(self, fig: Optional[plt.Figure] = None) -> plt.Figure:
-        """Plot all indicator scores as a bar chart
+    def _draw_indicators_bars(self, ax: "plt.Axes", title: str) -> None:
+        """Draw the indicator scores as zone-colored horizontal bars on ``ax``
 
         Parameters
         ----------
-        fig : plt.Figure, optional
-            Matplotlib figure to plot on. If None, creates new figure.
-
-        Returns
-        -------
-        plt.Figure
-            Matplotlib figure with the chart
+        ax : plt.Axes
+            Axes to draw on
+        title : str
+            Axes title
         """
-        if fig is None:
-            fig, ax = plt.subplots(figsize=(10, 6))
-        else:
-            ax = fig.add_subplot(111)
-
         names = [ind.name for ind in self.all_indicators]
         scores = [ind.score for ind in self.all_indicators]
 
         # Color based on score
-        colors = []
-        for score in scores:
-            if score < 25:
-                colors.append('#8B0000')  # Extreme Fear - dark red
-            elif score < 45:
-                colors.append('#FF4500')  # Fear - orange red
-            elif score < 55:
-                colors.append('#FFD700')  # Neutral - gold
-            elif score < 75:
-                colors.append('#90EE90')  # Greed - light green
-            else:
-                colors.append('#006400')  # Extreme Greed - dark green
-
-        bars = ax.barh(names, scores, color=colors)
+        bars = ax.barh(names, scores, color=_ZONE_BAR_COLORS[zone_indices(scores)])
         ax.set_xlim(0, 100)
         ax.set_xlabel("Score")
-        ax.set_title(f"Fear & Greed Indicators - Overall: {self.score:.1f} ({self.rating.title()})")
+        ax.set_title(title)
 
         # Add score labels on bars
         for bar, score in zip(bars, scores):
@@ -297,11 +381,35 @@ class CNNFearAndGreedIndex:
                     va='center', fontsize=9)
 
         ax.axvline(x=50, color='gray', linestyle='--', alpha=0.5)
+
+    def plot_all_indicators(self, fig: Optional["plt.Figure"] = None) -> "plt.Figure":
+        """Plot all indicator scores as a bar chart
+
+        Parameters
+        ----------
+        fig : plt.Figure, optional
+            Matplotlib figure to plot on. If None, creates new figure.
+
+        Returns
+        -------
+        plt.Figure
+            Matplotlib figure with the chart
+        """
+        import matplotlib.pyplot as plt
+
+        if fig is None:
+            fig, ax = plt.subplots(figsize=(10, 6))
+        else:
+            ax = fig.add_subplot(111)
+
+        self._draw_indicators_bars(
+            ax, f"Fear & Greed Indicators - Overall: {self.score:.1f} ({self.rating.title()})"
+        )
         plt.tight_layout()
 
         return fig
 
-    def plot_all_charts(self, fig: Optional[plt.Figure] = None) -> plt.Figure:
+    def plot_all_charts(self, fig: Optional["plt.Figure"] = None) -> "plt.Figure":
         """Plot comprehensive Fear and Greed dashboard
 
         Parameters
@@ -314,6 +422,8 @@ class CNNFearAndGreedIndex:
         plt.Figure
             Matplotlib figure with all charts
         """
+        import matplotlib.pyplot as plt
+
         if fig is None:
             fig = plt.figure(figsize=(14, 10))
 
@@ -323,32 +433,7 @@ class CNNFearAndGreedIndex:
 
         # Indicators bar chart (bottom)
         ax2 = fig.add_subplot(2, 1, 2)
-        names = [ind.name for ind in self.all_indicators]
-        scores = [ind.score for ind in self.all_indicators]
-
-        colors = []
-        for score in scores:
-            if score < 25:
-                colors.append('#8B0000')
-            elif score < 45:
-                colors.append('#FF4500')
-            elif score < 55:
-                colors.append('#FFD700')
-            elif score < 75:
-                colors.append('#90EE90')
-            else:
-                colors.append('#006400')
-
-        bars = ax2.barh(names, scores, color=colors)
-        ax2.set_xlim(0, 100)
-        ax2.set_xlabel("Score")
-        ax2.set_title("Individual Indicators")
-
-        for bar, score in zip(bars, scores):
-            ax2.text(score + 2, bar.get_y() + bar.get_height()/2, f'{score:.1f}',
-                    va='center', fontsize=9)
-
-        ax2.axvline(x=50, color='gray', linestyle='--', alpha=0.5)
+        self._draw_indicators_bars(ax2, "Individual Indicators")
 
         plt.tight_layout()
         return fig
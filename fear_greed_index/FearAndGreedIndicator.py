@@ -4,6 +4,32 @@ __docformat__ = "numpy"
 from datetime import datetime
 from typing import Any, Optional
 
+import numpy as np
+
+
+def _historical_columns(points: list) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert CNN's list of ``{"x", "y", "rating"}`` points to read-only columns
+
+    Parameters
+    ----------
+    points : list
+        Historical data points as returned by the CNN API
+
+    Returns
+    -------
+    tuple of np.ndarray
+        Epoch-millisecond timestamps (int64), scores (float64) and ratings (object)
+    """
+    n = len(points)
+    columns = (
+        np.fromiter((p["x"] for p in points), dtype=np.int64, count=n),
+        np.fromiter((p["y"] for p in points), dtype=np.float64, count=n),
+        np.array([p.get("rating", "") for p in points], dtype=object),
+    )
+    for column in columns:
+        column.flags.writeable = False
+    return columns
+
 
 class FearAndGreedIndicator:
     """Fear and Greed Indicator
@@ -22,6 +48,8 @@ class FearAndGreedIndicator:
         Historical data points with x (timestamp), y (value), and rating
     """
 
+    __slots__ = ("name", "score", "rating", "timestamp", "historical_data", "_historical_arrays")
+
     def __init__(self, name: str, data: Optional[dict] = None):
         """Constructor
 
@@ -37,20 +65,25 @@ class FearAndGreedIndicator:
         self.rating = "N/A"
         self.timestamp: Optional[datetime] = None
         self.historical_data: list[dict[str, Any]] = []
+        self._historical_arrays = None
 
         if data:
             self._load_from_data(data)
 
     def _load_from_data(self, data: dict):
-        """Load indicator data from API response"""
+        """Load indicator data from API response
+
+        Every field is assigned, falling back to its constructor default, so
+        reloading an existing indicator leaves nothing from the previous load.
+        """
         self.score = data.get("score", 0.0)
         self.rating = data.get("rating", "N/A")
 
         timestamp_ms = data.get("timestamp")
-        if timestamp_ms:
-            self.timestamp = datetime.fromtimestamp(timestamp_ms / 1000)
+        self.timestamp = datetime.fromtimestamp(timestamp_ms / 1000) if timestamp_ms else None
 
         self.historical_data = data.get("data", [])
+        self._historical_arrays = None
 
     def get_score(self) -> float:
         """Get indicator score"""
@@ -72,9 +105,20 @@ class FearAndGreedIndicator:
         """Get historical data"""
         return self.historical_data
 
+    def get_historical_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get historical data as read-only NumPy columns, converted once and cached
+
+        Returns
+        -------
+        tuple of np.ndarray
+            Epoch-millisecond timestamps (int64), values (float64) and ratings (object)
+        """
+        if self._historical_arrays is None:
+            self._historical_arrays = _historical_columns(self.historical_data)
+        return self._historical_arrays
+
     def get_report(self) -> str:
         """Get indicator report"""
         timestamp_str = self.timestamp.strftime("%b %d at %I:%M%p") if self.timestamp else "N/A"
         report = f"{self.name}: {self.rating.title()} ({self.score:.1f})"
-        report += f"{(80-len(report))*' '}[Updated {timestamp_str}]"
-        return report
+        return f"{report:<80}[Updated {timestamp_str}]"
@@ -0,0 +1,119 @@
+"""File-backed cache for CNN API responses"""
+__docformat__ = "numpy"
+
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+import orjson
+
+DEFAULT_TTL = 600.0
+
+
+def default_ttl() -> float:
+    """Get the cache TTL in seconds, from ``FGI_CACHE_TTL`` if set
+
+    Returns
+    -------
+    float
+        Maximum age of a cached response, in seconds
+    """
+    return float(os.environ.get("FGI_CACHE_TTL", DEFAULT_TTL))
+
+
+def default_directory() -> Path:
+    """Get the cache directory, from ``FGI_CACHE_DIR`` if set
+
+    Returns
+    -------
+    Path
+        Directory holding cached responses (``~/.fgi_cache`` by default)
+    """
+    return Path(os.environ.get("FGI_CACHE_DIR", Path.home() / ".fgi_cache"))
+
+
+class FileCache:
+    """JSON payloads stored on disk with the time they were fetched
+
+    Each key is one ``<key>.json`` file holding
+    ``{"fetched_at": <epoch seconds>, "data": <payload>}``. Writes go to a
+    temporary file that is atomically renamed into place, so concurrent
+    processes never observe a partially written entry.
+
+    Attributes
+    ----------
+    directory : Path
+        Directory holding the cache files
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None):
+        """Constructor
+
+        Parameters
+        ----------
+        directory : str or Path, optional
+            Cache directory. If None, uses ``default_directory()``.
+        """
+        self.directory = Path(directory) if directory is not None else default_directory()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str, ttl: float) -> Optional[dict]:
+        """Get a cached payload if it is younger than ``ttl`` seconds
+
+        Parameters
+        ----------
+        key : str
+            Cache entry name
+        ttl : float
+            Maximum age in seconds. Zero or less never hits.
+
+        Returns
+        -------
+        dict or None
+            Cached payload, or None if missing, expired or unreadable
+        """
+        if ttl <= 0:
+            return None
+        path = self._path(key)
+        try:
+            # The file is written when fetched, so an old mtime rules out a
+            # hit without parsing the payload.
+            if time.time() - path.stat().st_mtime >= ttl:
+                return None
+            with open(path, "rb") as f:
+                entry = orjson.loads(f.read())
+            if time.time() - entry["fetched_at"] < ttl:
+                return entry["data"]
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+            pass
+        return None
+
+    def set(self, key: str, data: dict) -> None:
+        """Store a payload, stamped with the current time
+
+        Failures (e.g. a read-only home directory) are ignored: the cache is
+        an optimization and must never break a fetch.
+
+        Parameters
+        ----------
+        key : str
+            Cache entry name
+        data : dict
+            JSON-serializable payload
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=f".{key}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(orjson.dumps({"fetched_at": time.time(), "data": data}))
+                os.replace(tmp, self._path(key))
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except (OSError, orjson.JSONEncodeError):
+            pass
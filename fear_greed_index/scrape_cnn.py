@@ -1,7 +1,18 @@
 """Scrape CNN Fear and Greed Index API"""
 __docformat__ = "numpy"
 
+import asyncio
+from typing import TYPE_CHECKING, Optional, Union
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from fear_greed_index._cache import FileCache, default_ttl
+
+if TYPE_CHECKING:
+    import httpx
 
 API_URL = "https://production.dataviz.cnn.io/index/fearandgreed/graphdata"
 
@@ -10,15 +21,145 @@ _HEADERS = {
     "Accept": "application/json",
 }
 
+# One pooled session per process keeps the TCP/TLS connection to CNN alive
+# across fetches (e.g. `fgi watch`, long-running MCP sessions).
+_session = requests.Session()
+_session.headers.update(_HEADERS)
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    # Retry transient gateway errors; raise_on_status=False hands the final
+    # response to raise_for_status so callers still see an HTTPError.
+    max_retries=Retry(
+        total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False
+    ),
+))
+
+_CACHE_KEY = "graphdata"
+_file_cache = FileCache()
+
+# Validators and parsed body of the last full response, so later fetches in
+# this process can be conditional and reuse the body on 304 Not Modified.
+_last_response = {"data": None, "etag": None, "last_modified": None}
+
+_async_client: Optional["httpx.AsyncClient"] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _conditional_headers() -> dict:
+    """Get If-None-Match/If-Modified-Since headers for the last full response
+
+    Returns
+    -------
+    dict
+        Conditional request headers, empty if nothing was fetched yet
+    """
+    headers = {}
+    if _last_response["data"] is not None:
+        if _last_response["etag"]:
+            headers["If-None-Match"] = _last_response["etag"]
+        if _last_response["last_modified"]:
+            headers["If-Modified-Since"] = _last_response["last_modified"]
+    return headers
+
+
+def _read_response(response: Union[requests.Response, "httpx.Response"]) -> dict:
+    """Get the payload of a (possibly conditional) response
+
+    On 304 the body parsed from the previous response is returned as-is;
+    otherwise the new body is parsed and its validators are remembered.
+
+    Parameters
+    ----------
+    response : requests.Response or httpx.Response
+        Response from the CNN API
+
+    Returns
+    -------
+    dict
+        JSON response containing fear and greed index data with all indicators
+    """
+    if response.status_code == 304 and _last_response["data"] is not None:
+        return _last_response["data"]
+    # raise_for_status inspects the reason phrase and URL even on success;
+    # only pay for it when the status is not the usual 200.
+    if response.status_code != 200:
+        response.raise_for_status()
+    data = orjson.loads(response.content)
+    _last_response.update(
+        data=data,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
+    return data
+
 
-def _get_fear_greed_data() -> dict:
+def _get_fear_greed_data(ttl: Optional[float] = None) -> dict:
     """Fetches CNN Fear and Greed Index data from API
 
+    Parameters
+    ----------
+    ttl : float, optional
+        Reuse a response cached on disk if it is younger than this many
+        seconds. If None, uses ``FGI_CACHE_TTL`` (default 600); 0 always fetches.
+
+    Returns
+    -------
+    dict
+        JSON response containing fear and greed index data with all indicators
+    """
+    data = _file_cache.get(_CACHE_KEY, default_ttl() if ttl is None else ttl)
+    if data is not None:
+        return data
+
+    response = _session.get(API_URL, headers=_conditional_headers(), timeout=30)
+    data = _read_response(response)
+    _file_cache.set(_CACHE_KEY, data)
+    return data
+
+
+def _get_async_client() -> "httpx.AsyncClient":
+    """Get the shared async HTTP client for the running event loop
+
+    The client is reused across calls so the TCP/TLS connection to CNN stays
+    open; a new one is created if called from a different event loop.
+
+    Returns
+    -------
+    httpx.AsyncClient
+        Client preconfigured with the CNN request headers
+    """
+    global _async_client, _async_client_loop
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client.is_closed or _async_client_loop is not loop:
+        _async_client = httpx.AsyncClient(headers=_HEADERS, timeout=30)
+        _async_client_loop = loop
+    return _async_client
+
+
+async def _get_fear_greed_data_async(ttl: Optional[float] = None) -> dict:
+    """Fetches CNN Fear and Greed Index data from API without blocking the event loop
+
+    Parameters
+    ----------
+    ttl : float, optional
+        Reuse a response cached on disk if it is younger than this many
+        seconds. If None, uses ``FGI_CACHE_TTL`` (default 600); 0 always fetches.
+
     Returns
     -------
     dict
         JSON response containing fear and greed index data with all indicators
     """
-    response = requests.get(API_URL, headers=_HEADERS, timeout=30)
-    response.raise_for_status()
-    return response.json()
+    ttl = default_ttl() if ttl is None else ttl
+    if ttl > 0:
+        data = await asyncio.to_thread(_file_cache.get, _CACHE_KEY, ttl)
+        if data is not None:
+            return data
+
+    response = await _get_async_client().get(API_URL, headers=_conditional_headers())
+    data = _read_response(response)
+    await asyncio.to_thread(_file_cache.set, _CACHE_KEY, data)
+    return data
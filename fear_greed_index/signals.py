@@ -0,0 +1,90 @@
+"""Trading signals derived from the Fear and Greed score"""
+__docformat__ = "numpy"
+
+from bisect import bisect_right
+from typing import NamedTuple
+
+
+class Signal(NamedTuple):
+    """Contrarian trading signal for a score band
+
+    Attributes
+    ----------
+    name : str
+        Signal name, e.g. "STRONG BUY"
+    recommendation : str
+        One-line recommendation
+    analysis : str
+        Longer explanation of the signal
+    color : str
+        Rich color used to display the signal
+    emoji : str
+        Emoji used to display the signal
+    """
+
+    name: str
+    recommendation: str
+    analysis: str
+    color: str
+    emoji: str
+
+
+# Exclusive upper bounds of the STRONG BUY, BUY, HOLD and SELL bands; scores at
+# or above the last bound are STRONG SELL.
+SIGNAL_THRESHOLDS = (20, 40, 60, 80)
+
+SIGNAL_TABLE = (
+    Signal(
+        "STRONG BUY",
+        "Extreme fear - potential buying opportunity",
+        "Extreme fear in the market. Historically, this represents a potential buying "
+        "opportunity as markets tend to be oversold.",
+        "green",
+        "🚀",
+    ),
+    Signal(
+        "BUY",
+        "Fear in market - consider accumulating",
+        "Fear in the market. Consider accumulating positions as sentiment is pessimistic.",
+        "green",
+        "📈",
+    ),
+    Signal(
+        "HOLD",
+        "Neutral sentiment - maintain positions",
+        "Neutral sentiment. Market is balanced - maintain current positions.",
+        "yellow",
+        "⏸️",
+    ),
+    Signal(
+        "SELL",
+        "Greed in market - consider taking profits",
+        "Greed in the market. Consider taking profits as sentiment is optimistic.",
+        "orange1",
+        "📉",
+    ),
+    Signal(
+        "STRONG SELL",
+        "Extreme greed - potential market top",
+        "Extreme greed in the market. Historically, this represents a potential market top. "
+        "Exercise caution.",
+        "red",
+        "🛑",
+    ),
+)
+
+
+def classify_signal(score: float) -> Signal:
+    """Get the trading signal for a score
+
+    Parameters
+    ----------
+    score : float
+        Fear and Greed score (0-100)
+
+    Returns
+    -------
+    Signal
+        Signal for the band the score falls in
+    """
+    return SIGNAL_TABLE[bisect_right(SIGNAL_THRESHOLDS, score)]
@@ -0,0 +1,47 @@
+"""Fear and Greed sentiment zones"""
+__docformat__ = "numpy"
+
+from bisect import bisect_right
+
+import numpy as np
+
+# Exclusive upper bounds of the extreme fear, fear, neutral and greed zones;
+# scores at or above the last bound are extreme greed.
+ZONE_THRESHOLDS = (25, 45, 55, 75)
+
+# Zone (0-4) of every integer score 0-100. The thresholds are integers, so
+# truncating a score to an int never moves it across a zone boundary.
+_ZONE_LUT = tuple(bisect_right(ZONE_THRESHOLDS, score) for score in range(101))
+_ZONE_LUT_ARRAY = np.array(_ZONE_LUT, dtype=np.intp)
+
+
+def zone_index(score: float) -> int:
+    """Get the sentiment zone of a score
+
+    Parameters
+    ----------
+    score : float
+        Fear and Greed score (0-100); values outside the range are clamped
+
+    Returns
+    -------
+    int
+        0 = extreme fear, 1 = fear, 2 = neutral, 3 = greed, 4 = extreme greed
+    """
+    return _ZONE_LUT[int(min(max(score, 0), 100))]
+
+
+def zone_indices(scores) -> np.ndarray:
+    """Get the sentiment zone of every score in an array
+
+    Parameters
+    ----------
+    scores : array_like
+        Fear and Greed scores (0-100); values outside the range are clamped
+
+    Returns
+    -------
+    np.ndarray
+        Zone index (0-4) per score, as returned by `zone_index`
+    """
+    return _ZONE_LUT_ARRAY[np.clip(np.asarray(scores, dtype=np.float64), 0, 100).astype(np.intp)]
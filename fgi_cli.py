@@ -1,14 +1,20 @@
 #!/usr/bin/env python3
 """CNN Fear & Greed Index CLI - Beautiful terminal interface."""
 
+import time
+from functools import lru_cache
+
 import click
-from rich.console import Console
+import numpy as np
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.style import Style
 from rich.text import Text
 from rich import box
-from datetime import datetime
+
+from fear_greed_index.signals import classify_signal
+from fear_greed_index.zones import zone_index, zone_indices
 
 console = Console()
 
@@ -23,64 +29,75 @@ COLORS = {
 }
 
 
+# (color, emoji) per sentiment zone, extreme fear -> extreme greed
+_ZONE_STYLES = (
+    (COLORS["extreme_fear"], "🔴"),
+    (COLORS["fear"], "🟠"),
+    (COLORS["neutral"], "🟡"),
+    (COLORS["greed"], "🟢"),
+    (COLORS["extreme_greed"], "💚"),
+)
+
+
+# Pre-parsed Rich styles, so rendering never re-parses style strings or markup
+_DIM = Style(dim=True)
+_POSITIVE = Style(color="green")
+_NEGATIVE = Style(color="red")
+_FEAR_LABEL = Style(color=COLORS["extreme_fear"], bold=True)
+_GREED_LABEL = Style(color=COLORS["extreme_greed"], bold=True)
+# (plain, bold) style per sentiment zone
+_ZONE_TEXT_STYLES = tuple(
+    (Style(color=color), Style(color=color, bold=True)) for color, _ in _ZONE_STYLES
+)
+
+
 def get_color_for_score(score: float) -> str:
     """Return rich color based on fear/greed score (matches web app)."""
-    if score < 25:
-        return COLORS["extreme_fear"]
-    elif score < 45:
-        return COLORS["fear"]
-    elif score < 55:
-        return COLORS["neutral"]
-    elif score < 75:
-        return COLORS["greed"]
-    else:
-        return COLORS["extreme_greed"]
+    return _ZONE_STYLES[zone_index(score)][0]
 
 
 def get_emoji_for_score(score: float) -> str:
     """Return emoji based on fear/greed score (matches web app zones)."""
-    if score < 25:
-        return "🔴"  # Extreme Fear
-    elif score < 45:
-        return "🟠"  # Fear
-    elif score < 55:
-        return "🟡"  # Neutral
-    elif score < 75:
-        return "🟢"  # Greed
-    else:
-        return "💚"  # Extreme Greed
+    return _ZONE_STYLES[zone_index(score)][1]
+
+
+@lru_cache(maxsize=None)
+def _gauge_bar(filled: int, width: int) -> tuple[str, str]:
+    """Return the (filled, empty) bar strings for a gauge of the given width."""
+    return "█" * filled, "░" * (width - filled)
 
 
 def create_gauge(score: float, width: int = 54) -> Text:
     """Create a text-based gauge as a Rich Text object with labels and pointer."""
     filled = int((score / 100) * width)
-    empty = width - filled
-    color = get_color_for_score(score)
+    bar_filled, bar_empty = _gauge_bar(filled, width)
+    style, bold_style = _ZONE_TEXT_STYLES[zone_index(score)]
 
-    # Calculate pointer position
-    pointer_pos = int((score / 100) * width)
+    # Pointer sits above the end of the filled bar
     label_offset = 7  # "FEAR 0 " length
 
-    gauge = Text()
-
-    # First line: pointer with score
-    gauge.append(" " * (label_offset + pointer_pos))
-    gauge.append(f"▼ {score:.0f}", style=f"bold {color}")
-    gauge.append("\n")
-
-    # Second line: the gauge bar with labels
-    gauge.append("FEAR ", style=f"bold {COLORS['extreme_fear']}")
-    gauge.append("0 ", style="dim")
-    gauge.append("█" * filled, style=color)
-    gauge.append("░" * empty, style="dim")
-    gauge.append(" 100", style="dim")
-    gauge.append(" GREED", style=f"bold {COLORS['extreme_greed']}")
+    return Text.assemble(
+        # First line: pointer with score
+        " " * (label_offset + filled),
+        (f"▼ {score:.0f}", bold_style),
+        "\n",
+        # Second line: the gauge bar with labels
+        ("FEAR ", _FEAR_LABEL),
+        ("0 ", _DIM),
+        (bar_filled, style),
+        (bar_empty, _DIM),
+        (" 100", _DIM),
+        (" GREED", _GREED_LABEL),
+    )
 
-    return gauge
 
+def load_data(ttl=None):
+    """Load Fear & Greed data with spinner.
 
-def load_data():
-    """Load Fear & Greed data with spinner."""
+    ``ttl`` bounds the age of a response reused from the on-disk cache
+    (default: ``FGI_CACHE_TTL``, 600 seconds).
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -89,7 +106,7 @@ def load_data():
     ) as progress:
         progress.add_task("Fetching Fear & Greed data...", total=None)
         from fear_greed_index import CNNFearAndGreedIndex
-        return CNNFearAndGreedIndex()
+        return CNNFearAndGreedIndex(ttl=ttl)
 
 
 @click.group(invoke_without_command=True)
@@ -105,25 +122,25 @@ def dashboard():
     """Display the full Fear & Greed dashboard."""
     fgi = load_data()
 
-    color = get_color_for_score(fgi.score)
-    emoji = get_emoji_for_score(fgi.score)
+    zone = zone_index(fgi.score)
+    emoji = _ZONE_STYLES[zone][1]
+    bold_style = _ZONE_TEXT_STYLES[zone][1]
 
     # Main score panel
     score_text = Text()
     score_text.append("\n")
     score_text.append_text(create_gauge(fgi.score))
     score_text.append("\n\n")
-    score_text.append(f"  {fgi.score:.1f}", style=f"bold {color}")
-    score_text.append(f"  {fgi.rating.upper()} {emoji}\n", style=f"bold {color}")
+    score_text.append(f"  {fgi.score:.1f}", style=bold_style)
+    score_text.append(f"  {fgi.rating.upper()} {emoji}\n", style=bold_style)
 
     panel = Panel(
         score_text,
         title="[bold cyan]CNN FEAR & GREED INDEX[/bold cyan]",
-        subtitle=f"[dim]Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}[/dim]",
+        subtitle=f"[dim]Updated: {time.strftime('%Y-%m-%d %H:%M')}[/dim]",
         box=box.DOUBLE,
         padding=(0, 2),
     )
-    console.print(panel)
 
     # Comparison table
     comparison = Table(box=box.ROUNDED, show_header=True, header_style="bold cyan")
@@ -140,11 +157,12 @@ def dashboard():
 
     for period, value in periods:
         change = fgi.score - value
-        change_str = f"[green]+{change:.1f}[/green]" if change > 0 else f"[red]{change:.1f}[/red]"
-        comparison.add_row(period, f"{value:.1f}", change_str)
-
-    console.print(comparison)
-    console.print()
+        change_text = (
+            Text.assemble((f"+{change:.1f}", _POSITIVE))
+            if change > 0
+            else Text.assemble((f"{change:.1f}", _NEGATIVE))
+        )
+        comparison.add_row(period, f"{value:.1f}", change_text)
 
     # Indicators table
     indicators = Table(
@@ -159,25 +177,31 @@ def dashboard():
     indicators.add_column("", justify="center", width=3)
 
     for ind in fgi.all_indicators:
-        ind_color = get_color_for_score(ind.score)
-        ind_emoji = get_emoji_for_score(ind.score)
+        zone = zone_index(ind.score)
+        ind_style = _ZONE_TEXT_STYLES[zone][0]
         indicators.add_row(
             ind.name,
-            f"[{ind_color}]{ind.score:.1f}[/{ind_color}]",
-            f"[{ind_color}]{ind.rating.title()}[/{ind_color}]",
-            ind_emoji
+            Text.assemble((f"{ind.score:.1f}", ind_style)),
+            Text.assemble((ind.rating.title(), ind_style)),
+            _ZONE_STYLES[zone][1]
         )
 
-    console.print(indicators)
+    # One print call: Rich lays out and writes the whole dashboard at once
+    console.print(Group(panel, comparison, "", indicators))
 
 
 @cli.command()
 def score():
     """Display just the current score."""
     fgi = load_data()
-    color = get_color_for_score(fgi.score)
-    emoji = get_emoji_for_score(fgi.score)
-    console.print(f"{emoji} [{color}]{fgi.score:.1f}[/{color}] - [{color}]{fgi.rating.upper()}[/{color}]")
+    zone = zone_index(fgi.score)
+    style, bold_style = _ZONE_TEXT_STYLES[zone]
+    console.print(Text.assemble(
+        f"{_ZONE_STYLES[zone][1]} ",
+        (f"{fgi.score:.1f}", bold_style),
+        " - ",
+        (fgi.rating.upper(), style),
+    ))
 
 
 @cli.command()
@@ -185,34 +209,11 @@ def signal():
     """Display trading signal based on sentiment."""
     fgi = load_data()
 
-    if fgi.score < 20:
-        signal = "STRONG BUY"
-        recommendation = "Extreme fear - potential buying opportunity"
-        color = "green"
-        emoji = "🚀"
-    elif fgi.score < 40:
-        signal = "BUY"
-        recommendation = "Fear in market - consider accumulating"
-        color = "green"
-        emoji = "📈"
-    elif fgi.score < 60:
-        signal = "HOLD"
-        recommendation = "Neutral sentiment - maintain positions"
-        color = "yellow"
-        emoji = "⏸️"
-    elif fgi.score < 80:
-        signal = "SELL"
-        recommendation = "Greed in market - consider taking profits"
-        color = "orange1"
-        emoji = "📉"
-    else:
-        signal = "STRONG SELL"
-        recommendation = "Extreme greed - potential market top"
-        color = "red"
-        emoji = "🛑"
+    signal = classify_signal(fgi.score)
 
     panel = Panel(
-        f"\n{emoji} [{color} bold]{signal}[/{color} bold]\n\n[dim]{recommendation}[/dim]\n\nScore: {fgi.score:.1f} ({fgi.rating})\n",
+        f"\n{signal.emoji} [{signal.color} bold]{signal.name}[/{signal.color} bold]\n\n"
+        f"[dim]{signal.recommendation}[/dim]\n\nScore: {fgi.score:.1f} ({fgi.rating})\n",
         title="[bold cyan]TRADING SIGNAL[/bold cyan]",
         box=box.DOUBLE,
     )
@@ -224,9 +225,11 @@ def indicators():
     """Display all indicators in detail."""
     fgi = load_data()
 
+    panels = []
     for ind in fgi.all_indicators:
-        color = get_color_for_score(ind.score)
-        emoji = get_emoji_for_score(ind.score)
+        zone = zone_index(ind.score)
+        emoji = _ZONE_STYLES[zone][1]
+        style = _ZONE_TEXT_STYLES[zone][0]
         timestamp = ind.timestamp.strftime("%Y-%m-%d %H:%M") if ind.timestamp else "N/A"
 
         content = Text()
@@ -234,18 +237,19 @@ def indicators():
         content.append_text(create_gauge(ind.score))
         content.append("\n\n")
         content.append("Score: ")
-        content.append(f"{ind.score:.1f}", style=color)
+        content.append(f"{ind.score:.1f}", style=style)
         content.append("  Rating: ")
-        content.append(f"{ind.rating.title()}", style=color)
+        content.append(f"{ind.rating.title()}", style=style)
         content.append(f" {emoji}\n")
-        content.append(f"Updated: {timestamp}\n", style="dim")
+        content.append(f"Updated: {timestamp}\n", style=_DIM)
 
-        panel = Panel(
+        panels.append(Panel(
             content,
             title=f"[bold]{ind.name}[/bold]",
             box=box.ROUNDED,
-        )
-        console.print(panel)
+        ))
+
+    console.print(Group(*panels))
 
 
 @cli.command()
@@ -265,19 +269,18 @@ def history(limit):
     table.add_column("Rating", justify="center")
     table.add_column("", justify="center", width=3)
 
-    historical = fgi.get_historical_data()[-limit:]
-    for point in reversed(historical):
-        date = datetime.fromtimestamp(point["x"] / 1000).strftime("%Y-%m-%d")
-        score = point["y"]
-        rating = point["rating"]
-        color = get_color_for_score(score)
-        emoji = get_emoji_for_score(score)
+    x, y, ratings = (column[-limit:][::-1] for column in fgi.get_historical_arrays())
+    # Format the dates and classify the whole window in one vectorized pass each
+    dates = np.datetime_as_string(x.astype("datetime64[ms]"), unit="D").tolist()
+    zones = zone_indices(y).tolist()
+    for date, score, rating, zone in zip(dates, y.tolist(), ratings.tolist(), zones):
+        style = _ZONE_TEXT_STYLES[zone][0]
 
         table.add_row(
             date,
-            f"[{color}]{score:.1f}[/{color}]",
-            f"[{color}]{rating.title()}[/{color}]",
-            emoji
+            Text.assemble((f"{score:.1f}", style)),
+            Text.assemble((rating.title(), style)),
+            _ZONE_STYLES[zone][1]
         )
 
     console.print(table)
@@ -286,7 +289,7 @@ def history(limit):
 @cli.command()
 def json():
     """Output data as JSON."""
-    import json as json_lib
+    import orjson
     fgi = load_data()
 
     data = {
@@ -304,47 +307,70 @@ def json():
     }
 
     from rich.syntax import Syntax
-    syntax = Syntax(json_lib.dumps(data, indent=2), "json", theme="monokai")
+    syntax = Syntax(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode(), "json", theme="monokai")
     console.print(syntax)
 
 
+# Rendered watch summary: (indicator scores, console width) -> ANSI text
+_watch_summary_cache = {}
+
+
+def _watch_summary(fgi) -> str:
+    """Return the watch-mode indicator summary, rendered once per distinct set of scores."""
+    key = (tuple((ind.name, ind.score) for ind in fgi.all_indicators), console.width)
+    summary = _watch_summary_cache.get(key)
+    if summary is None:
+        with console.capture() as capture:
+            for ind in fgi.all_indicators:
+                zone = zone_index(ind.score)
+                console.print(Text.assemble(
+                    f"  {_ZONE_STYLES[zone][1]} ",
+                    (f"{ind.score:5.1f}", _ZONE_TEXT_STYLES[zone][1]),
+                    f" {ind.name}",
+                ))
+            console.print("\n[dim]Press Ctrl+C to exit[/dim]")
+        summary = capture.get()
+        # Only the latest scores are ever shown again
+        _watch_summary_cache.clear()
+        _watch_summary_cache[key] = summary
+    return summary
+
+
 @cli.command()
 def watch():
     """Watch mode - refresh every 60 seconds."""
-    from time import sleep
-
     console.print("[bold cyan]Watch mode[/bold cyan] - Press Ctrl+C to exit\n")
 
     try:
+        # Never reuse a cached response older than one refresh interval
+        fgi = load_data(ttl=60)
         while True:
             console.clear()
-            fgi = load_data()
 
-            color = get_color_for_score(fgi.score)
-            emoji = get_emoji_for_score(fgi.score)
+            zone = zone_index(fgi.score)
+            emoji = _ZONE_STYLES[zone][1]
+            style, bold_style = _ZONE_TEXT_STYLES[zone]
 
             content = Text()
             content.append("\n")
             content.append_text(create_gauge(fgi.score))
             content.append("\n\n")
-            content.append(f"  {fgi.score:.1f}", style=f"bold {color}")
-            content.append(f"  {fgi.rating.upper()} {emoji}\n", style=color)
+            content.append(f"  {fgi.score:.1f}", style=bold_style)
+            content.append(f"  {fgi.rating.upper()} {emoji}\n", style=style)
 
             console.print(Panel(
                 content,
                 title="[bold cyan]CNN FEAR & GREED INDEX[/bold cyan]",
-                subtitle=f"[dim]Refreshing every 60s | {datetime.now().strftime('%H:%M:%S')}[/dim]",
+                subtitle=f"[dim]Refreshing every 60s | {time.strftime('%H:%M:%S')}[/dim]",
                 box=box.DOUBLE,
             ))
 
-            # Quick indicators summary
-            for ind in fgi.all_indicators:
-                ind_emoji = get_emoji_for_score(ind.score)
-                ind_color = get_color_for_score(ind.score)
-                console.print(f"  {ind_emoji} [{ind_color}]{ind.score:5.1f}[/{ind_color}] {ind.name}")
-
-            console.print("\n[dim]Press Ctrl+C to exit[/dim]")
-            sleep(60)
+            # Quick indicators summary; it only changes when CNN publishes
+            # new indicator scores, so most refreshes replay the cached ANSI.
+            console.file.write(_watch_summary(fgi))
+            console.file.flush()
+            time.sleep(60)
+            fgi.refresh(ttl=60)
     except KeyboardInterrupt:
         console.print("\n[yellow]Stopped watching.[/yellow]")
 
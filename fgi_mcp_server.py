@@ -8,20 +8,59 @@ Run with: uv run python fgi_mcp_server.py
 """
 
 import asyncio
-from datetime import datetime
+import time
+
+import numpy as np
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
 from fear_greed_index import CNNFearAndGreedIndex
+from fear_greed_index.signals import classify_signal
+
+# Static parts of the tool responses
+_SIGNAL_DISCLAIMER = (
+    "Disclaimer: This is not financial advice. The Fear & Greed Index is one of many "
+    "indicators and should not be used as the sole basis for investment decisions."
+)
+_INDICATORS_HEADER = "Fear & Greed Indicators\n" + "=" * 50
 
 # Create MCP server instance
 server = Server("fear-greed-index")
 
 
-def get_fgi_data() -> CNNFearAndGreedIndex:
-    """Fetch current Fear & Greed Index data."""
-    return CNNFearAndGreedIndex()
+# Tool calls in one session tend to arrive back-to-back; share one parsed
+# index between them for a short window. While a fetch is in flight, every
+# caller awaits that same task instead of issuing its own request.
+_cache = {"data": None, "fetched_at": 0.0, "fetch_task": None}
+_CACHE_TTL = 30
+
+
+async def _fetch() -> CNNFearAndGreedIndex:
+    """Fetch the index once and publish it to the in-memory cache."""
+    try:
+        fgi = await CNNFearAndGreedIndex.create()
+        _cache.update(data=fgi, fetched_at=time.monotonic())
+        return fgi
+    finally:
+        _cache["fetch_task"] = None
+
+
+async def get_fgi_data() -> CNNFearAndGreedIndex:
+    """Fetch current Fear & Greed Index data, reusing a response cached on disk.
+
+    Uses the async HTTP client so the stdio event loop keeps serving other
+    tool calls while the request to CNN is in flight. The parsed index is
+    kept in memory for 30 seconds, and all calls that arrive while a fetch
+    is running share its result.
+    """
+    if _cache["data"] is not None and time.monotonic() - _cache["fetched_at"] < _CACHE_TTL:
+        return _cache["data"]
+    if _cache["fetch_task"] is None:
+        _cache["fetch_task"] = asyncio.create_task(_fetch())
+    # Shield the shared task so one cancelled tool call does not cancel the
+    # fetch for the others waiting on it.
+    return await asyncio.shield(_cache["fetch_task"])
 
 
 @server.list_tools()
@@ -102,7 +141,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Handle tool calls from MCP clients."""
 
     if name == "get_fear_greed_score":
-        fgi = get_fgi_data()
+        fgi = await get_fgi_data()
         result = (
             f"CNN Fear & Greed Index\n"
             f"======================\n"
@@ -113,14 +152,14 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         return [TextContent(type="text", text=result)]
 
     elif name == "get_fear_greed_indicators":
-        fgi = get_fgi_data()
-        lines = ["Fear & Greed Indicators", "=" * 50]
+        fgi = await get_fgi_data()
+        lines = [_INDICATORS_HEADER]
         for ind in fgi.all_indicators:
             lines.append(f"{ind.name}: {ind.score:.1f} ({ind.rating})")
         return [TextContent(type="text", text="\n".join(lines))]
 
     elif name == "get_fear_greed_comparison":
-        fgi = get_fgi_data()
+        fgi = await get_fgi_data()
         result = (
             f"Fear & Greed Comparison\n"
             f"=======================\n"
@@ -133,48 +172,33 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         return [TextContent(type="text", text=result)]
 
     elif name == "get_trading_signal":
-        fgi = get_fgi_data()
-
-        if fgi.score < 20:
-            signal = "STRONG BUY"
-            recommendation = "Extreme fear in the market. Historically, this represents a potential buying opportunity as markets tend to be oversold."
-        elif fgi.score < 40:
-            signal = "BUY"
-            recommendation = "Fear in the market. Consider accumulating positions as sentiment is pessimistic."
-        elif fgi.score < 60:
-            signal = "HOLD"
-            recommendation = "Neutral sentiment. Market is balanced - maintain current positions."
-        elif fgi.score < 80:
-            signal = "SELL"
-            recommendation = "Greed in the market. Consider taking profits as sentiment is optimistic."
-        else:
-            signal = "STRONG SELL"
-            recommendation = "Extreme greed in the market. Historically, this represents a potential market top. Exercise caution."
+        fgi = await get_fgi_data()
+
+        signal = classify_signal(fgi.score)
 
         result = (
-            f"Trading Signal: {signal}\n"
+            f"Trading Signal: {signal.name}\n"
             f"================\n"
             f"Score: {fgi.score:.1f} ({fgi.rating})\n\n"
-            f"Analysis: {recommendation}\n\n"
-            f"Disclaimer: This is not financial advice. The Fear & Greed Index is one of many "
-            f"indicators and should not be used as the sole basis for investment decisions."
+            f"Analysis: {signal.analysis}\n\n"
+            f"{_SIGNAL_DISCLAIMER}"
         )
         return [TextContent(type="text", text=result)]
 
     elif name == "get_fear_greed_history":
         days = arguments.get("days", 10)
-        fgi = get_fgi_data()
-        historical = fgi.get_historical_data()[-days:]
+        fgi = await get_fgi_data()
+        x, y, ratings = (column[-days:][::-1] for column in fgi.get_historical_arrays())
 
         lines = [f"Fear & Greed History (Last {days} Days)", "=" * 40]
-        for point in reversed(historical):
-            date = datetime.fromtimestamp(point["x"] / 1000).strftime("%Y-%m-%d")
-            lines.append(f"{date}: {point['y']:.1f} ({point['rating']})")
+        dates = np.datetime_as_string(x.astype("datetime64[ms]"), unit="D").tolist()
+        for date, score, rating in zip(dates, y.tolist(), ratings.tolist()):
+            lines.append(f"{date}: {score:.1f} ({rating})")
 
         return [TextContent(type="text", text="\n".join(lines))]
 
     elif name == "get_complete_report":
-        fgi = get_fgi_data()
+        fgi = await get_fgi_data()
         return [TextContent(type="text", text=fgi.get_complete_report())]
 
     else:
@@ -1,5 +1,4 @@
 from fear_greed_index import CNNFearAndGreedIndex
-import matplotlib.pyplot as plt
 
 cnn_fg = CNNFearAndGreedIndex()
 
@@ -16,4 +15,5 @@ fig.savefig("fear_greed_dashboard.png", dpi=150, bbox_inches='tight')
 print("\nSaved chart to fear_greed_dashboard.png")
 
 # Show the chart (comment out if running headless)
+import matplotlib.pyplot as plt
 plt.show()
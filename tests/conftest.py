@@ -0,0 +1,122 @@
+"""Shared test fixtures.
+
+Requests to the CNN API are answered from ``fixtures/cnn_payload.json``, a
+recorded graphdata response, so the suite is fast, deterministic and runs
+offline. The replay happens at the transport level: the session, retry,
+conditional-request and parsing code in ``scrape_cnn`` still runs. Tests
+marked ``network`` (deselected by default) talk to the real endpoint.
+"""
+
+import io
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import orjson
+import pytest
+import requests
+from click.testing import CliRunner
+from requests.adapters import BaseAdapter
+
+import fgi_cli
+from fear_greed_index import CNNFearAndGreedIndex, scrape_cnn
+from fear_greed_index._cache import FileCache
+
+CNN_PAYLOAD = (Path(__file__).parent / "fixtures" / "cnn_payload.json").read_bytes()
+
+# Real transports, captured before the replay fixture swaps them out
+_LIVE_ADAPTER = scrape_cnn._session.get_adapter(scrape_cnn.API_URL)
+_LIVE_ASYNC_CLIENT = scrape_cnn._get_async_client
+
+
+class _ReplayAdapter(BaseAdapter):
+    """requests transport adapter that answers every request with the recorded payload."""
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = request.url
+        response.request = request
+        response.headers["Content-Type"] = "application/json"
+        response.raw = io.BytesIO(CNN_PAYLOAD)
+        return response
+
+    def close(self):
+        pass
+
+
+def _replay_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=CNN_PAYLOAD, headers={"Content-Type": "application/json"})
+
+
+@pytest.fixture(scope="session", autouse=True)
+def replay_cnn(tmp_path_factory):
+    """Serve the recorded CNN payload instead of the network for the whole session."""
+    transport = httpx.MockTransport(_replay_handler)
+
+    def get_async_client():
+        return httpx.AsyncClient(transport=transport)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(scrape_cnn._session.adapters, "https://", _ReplayAdapter())
+        mp.setattr(scrape_cnn, "_get_async_client", get_async_client)
+        # Keep the on-disk response cache out of the user's home directory
+        mp.setattr(scrape_cnn, "_file_cache", FileCache(tmp_path_factory.mktemp("fgi_cache")))
+        yield
+
+
+@pytest.fixture(autouse=True)
+def live_cnn(request, monkeypatch):
+    """Restore the real transports for tests marked ``network``."""
+    if request.node.get_closest_marker("network") is None:
+        return
+    monkeypatch.setitem(scrape_cnn._session.adapters, "https://", _LIVE_ADAPTER)
+    monkeypatch.setattr(scrape_cnn, "_get_async_client", _LIVE_ASYNC_CLIENT)
+    monkeypatch.setattr(scrape_cnn, "_last_response",
+                        {"data": None, "etag": None, "last_modified": None})
+
+
+@pytest.fixture(scope="session")
+def cnn_payload():
+    """Recorded CNN API response, parsed."""
+    return orjson.loads(CNN_PAYLOAD)
+
+
+@pytest.fixture(scope="session")
+def fgi(replay_cnn):
+    """Create one FGI instance shared by every test in the session."""
+    return CNNFearAndGreedIndex()
+
+
+@pytest.fixture(scope="session")
+def reports(fgi):
+    """Text reports and historical data of the session index, built once."""
+    return SimpleNamespace(
+        summary=fgi.get_index_summary(),
+        indicators=fgi.get_indicators_report(),
+        complete=fgi.get_complete_report(),
+        historical=fgi.get_historical_data(),
+    )
+
+
+@pytest.fixture(scope="session")
+def historical_df(fgi):
+    """Historical scores of the session index as a README-style DataFrame, built once."""
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame(fgi.get_historical_data())
+    df["date"] = pd.to_datetime(df["x"], unit="ms")
+    return df.rename(columns={"y": "score"})[["date", "score", "rating"]]
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Click test runner, shared because it keeps no state between invocations."""
+    return CliRunner()
+
+
+@pytest.fixture
+def cli_fgi(fgi, monkeypatch):
+    """Make CLI commands display the session's index instead of loading their own."""
+    monkeypatch.setattr(fgi_cli, "load_data", lambda ttl=None: fgi)
+    return fgi
@@ -0,0 +1,117 @@
+"""Tests for the FastAPI server."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api_server
+
+# Ask for an uncompressed body unless a test is about gzip
+_IDENTITY = {"Accept-Encoding": "identity"}
+
+
+@pytest.fixture(scope="module")
+def client(replay_cnn):
+    """API client over a cache filled once from the replayed CNN payload."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(api_server, "_cache", {**api_server._cache, "data": None})
+        client = TestClient(api_server.app, headers=_IDENTITY)
+        client.get("/score")
+        yield client
+
+
+class TestEndpoints:
+    """Tests for the response bodies of each endpoint."""
+
+    def test_root(self, client, fgi):
+        """Test / returns the score, comparisons and every indicator."""
+        body = client.get("/").json()
+        assert body["score"] == fgi.score
+        assert body["rating"] == fgi.rating
+        assert body["previous_close"] == fgi.previous_close
+        assert [ind["name"] for ind in body["indicators"]] == [
+            ind.name for ind in fgi.all_indicators
+        ]
+        assert set(body["indicators"][0]) == {"name", "score", "rating", "timestamp"}
+
+    def test_score(self, client, fgi):
+        """Test /score returns only the score and rating."""
+        assert client.get("/score").json() == {"score": fgi.score, "rating": fgi.rating}
+
+    def test_signal(self, client, fgi):
+        """Test /signal returns the signal for the current score."""
+        body = client.get("/signal").json()
+        assert body["score"] == fgi.score
+        assert body["signal"] == "BUY"
+        assert body["recommendation"] == "Fear in market - consider accumulating"
+
+    @pytest.mark.parametrize("name", [
+        "vix",
+        "market_volatility_vix",
+        "Market Volatility (VIX)",
+        "MARKET-VOLATILITY",
+    ])
+    def test_indicator_aliases(self, client, name):
+        """Test an indicator is found by display name, API key or partial name."""
+        assert client.get(f"/indicator/{name}").json()["name"] == "Market Volatility (VIX)"
+
+    def test_indicator_not_found(self, client):
+        """Test an unknown indicator returns an error body."""
+        assert client.get("/indicator/nonexistent").json() == {
+            "error": "Indicator 'nonexistent' not found"
+        }
+
+    @pytest.mark.parametrize("query,count", [
+        ("", 30),
+        ("?limit=7", 7),
+        ("?limit=10", 10),
+    ])
+    def test_historical_limit(self, client, fgi, query, count):
+        """Test /historical returns the most recent points, pre-serialized or not."""
+        body = client.get(f"/historical{query}").json()
+        assert len(body) == count
+        assert body[-1]["score"] == fgi.historical_data[-1]["y"]
+        assert body[-1]["date"].endswith("Z")
+
+
+class TestHTTPCaching:
+    """Tests for ETag revalidation and gzip pre-compression."""
+
+    def test_if_none_match(self, client):
+        """Test a revalidation with the current ETag gets an empty 304."""
+        etag = client.get("/score").headers["ETag"]
+        response = client.get("/score", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_gzip(self, client):
+        """Test large bodies are gzipped under their own ETag."""
+        plain = client.get("/historical")
+        gzipped = client.get("/historical", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in plain.headers
+        assert gzipped.headers["Content-Encoding"] == "gzip"
+        assert gzipped.headers["ETag"] == plain.headers["ETag"][:-1] + '-gzip"'
+        assert gzipped.json() == plain.json()
+
+    def test_small_body_not_gzipped(self, client):
+        """Test bodies below the size threshold are sent uncompressed."""
+        response = client.get("/score", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+
+
+class TestRefresh:
+    """Tests for the background cache refresh."""
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_payload(self, client, monkeypatch):
+        """Test a failed refresh keeps serving the previous payload."""
+        body = client.get("/").content
+
+        async def create(ttl=None):
+            raise ConnectionError("CNN unreachable")
+
+        monkeypatch.setattr(api_server.CNNFearAndGreedIndex, "create", create)
+        api_server._cache["refreshing"] = True
+        await api_server._refresh_in_background()
+
+        assert api_server._cache["refreshing"] is False
+        assert client.get("/").content == body
@@ -1,5 +1,6 @@
 """Tests for Streamlit app functions."""
 
+import numpy as np
 import pytest
 import sys
 
@@ -18,10 +19,18 @@ class MockStreamlit:
     def divider(self): pass
     def button(self, *args): return False
     cache_data = staticmethod(lambda **kw: lambda f: f)
+    cache_resource = staticmethod(lambda **kw: lambda f: f)
 
 sys.modules['streamlit'] = MockStreamlit()
 
-from app import get_color_for_score, create_gauge, create_historical_chart, create_indicators_chart
+from app import (
+    MAX_CHART_POINTS,
+    create_gauge,
+    create_historical_chart,
+    create_indicators_chart,
+    downsample_lttb,
+    get_color_for_score,
+)
 from fear_greed_index import CNNFearAndGreedIndex
 
 
@@ -49,6 +58,43 @@ class TestAppHelpers:
         assert get_color_for_score(85) == "#006400"
 
 
+class TestDownsampleLTTB:
+    """Tests for LTTB downsampling of the historical chart."""
+
+    @pytest.fixture
+    def series(self):
+        """A noisy 1000-point series with daily epoch-ms timestamps."""
+        rng = np.random.default_rng(0)
+        x = 1701475200000 + np.arange(1000, dtype=np.int64) * 86_400_000
+        y = 50 + rng.normal(0, 5, 1000).cumsum() / 10
+        return x, y
+
+    def test_keeps_threshold_points(self, series):
+        """Test exactly threshold points are kept, including both ends."""
+        keep = downsample_lttb(*series, 100)
+        assert len(keep) == 100
+        assert keep[0] == 0
+        assert keep[-1] == 999
+
+    def test_indices_strictly_increase(self, series):
+        """Test the kept indices are in order with no duplicates."""
+        keep = downsample_lttb(*series, 100)
+        assert (np.diff(keep) > 0).all()
+
+    @pytest.mark.parametrize("threshold", [1000, 2000, 2, 0])
+    def test_small_or_large_threshold(self, series, threshold):
+        """Test thresholds >= n or < 3 keep every point."""
+        np.testing.assert_array_equal(downsample_lttb(*series, threshold), np.arange(1000))
+
+    def test_spike_survives(self):
+        """Test a single spike inside a bucket is kept."""
+        x = np.arange(1000, dtype=np.int64)
+        y = np.full(1000, 50.0)
+        y[503] = 95.0
+        keep = downsample_lttb(x, y, 50)
+        assert 503 in keep
+
+
 class TestCharts:
     """Tests for chart creation functions."""
 
@@ -70,12 +116,20 @@ class TestCharts:
 
     def test_create_historical_chart(self, fgi):
         """Test historical chart creation."""
-        fig = create_historical_chart(fgi.historical_data[:10])
+        x, y, _ = fgi.get_historical_arrays()
+        fig = create_historical_chart(x[:10], y[:10])
         assert fig is not None
 
+    def test_create_historical_chart_downsamples(self):
+        """Test long histories are cut to MAX_CHART_POINTS before plotting."""
+        x = 1701475200000 + np.arange(2000, dtype=np.int64) * 86_400_000
+        y = np.linspace(0, 100, 2000)
+        fig = create_historical_chart(x, y)
+        assert len(fig.data[0].y) == MAX_CHART_POINTS
+
     def test_create_historical_chart_empty(self):
         """Test historical chart with minimal data."""
-        fig = create_historical_chart([{"x": 1701475200000, "y": 50}])
+        fig = create_historical_chart(np.array([1701475200000]), np.array([50.0]))
         assert fig is not None
 
     def test_create_indicators_chart(self, fgi):
@@ -0,0 +1,31 @@
+"""Benchmarks guarding the index construction path against regressions.
+
+Run with ``uv run pytest tests/test_benchmark.py``; compare against a saved
+run with ``--benchmark-autosave`` and ``--benchmark-compare``.
+"""
+
+import pytest
+
+from fear_greed_index import CNNFearAndGreedIndex
+
+pytest.importorskip("pytest_benchmark")
+
+# Soft ceiling on the mean construction time, far above the expected cost,
+# so only an accidental algorithmic regression trips it.
+MAX_MEAN_SECONDS = 0.05
+
+
+def test_construct_from_payload(benchmark, cnn_payload):
+    """Benchmark loading a recorded payload into an index."""
+    benchmark.group = "construct"
+    fgi = benchmark(CNNFearAndGreedIndex, cnn_payload)
+    assert len(fgi.all_indicators) == 7
+    assert benchmark.stats.stats.mean < MAX_MEAN_SECONDS
+
+
+def test_construct_from_replayed_response(benchmark):
+    """Benchmark a full uncached fetch: request, JSON parse and load."""
+    benchmark.group = "construct"
+    fgi = benchmark(CNNFearAndGreedIndex, ttl=0)
+    assert len(fgi.all_indicators) == 7
+    assert benchmark.stats.stats.mean < MAX_MEAN_SECONDS
@@ -0,0 +1,94 @@
+"""Tests for the on-disk CNN response cache."""
+
+import json
+import time
+
+import orjson
+
+from fear_greed_index._cache import FileCache, default_directory, default_ttl
+
+
+class TestFileCache:
+    """Tests for FileCache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test a stored payload is returned within the TTL."""
+        cache = FileCache(tmp_path)
+        cache.set("graphdata", {"score": 42.0})
+        assert cache.get("graphdata", ttl=60) == {"score": 42.0}
+
+    def test_missing_entry(self, tmp_path):
+        """Test a missing entry is a miss."""
+        assert FileCache(tmp_path).get("graphdata", ttl=60) is None
+
+    def test_expired_entry(self, tmp_path):
+        """Test an entry older than the TTL is a miss."""
+        path = tmp_path / "graphdata.json"
+        path.write_text(json.dumps({"fetched_at": time.time() - 120, "data": {"score": 1}}))
+        assert FileCache(tmp_path).get("graphdata", ttl=60) is None
+
+    def test_zero_ttl_never_hits(self, tmp_path):
+        """Test ttl=0 always bypasses the cache."""
+        cache = FileCache(tmp_path)
+        cache.set("graphdata", {"score": 42.0})
+        assert cache.get("graphdata", ttl=0) is None
+
+    def test_corrupt_entry(self, tmp_path):
+        """Test an unreadable file is treated as a miss."""
+        (tmp_path / "graphdata.json").write_text("{not json")
+        assert FileCache(tmp_path).get("graphdata", ttl=60) is None
+
+    def test_set_leaves_no_temp_files(self, tmp_path):
+        """Test writes are renamed into place."""
+        FileCache(tmp_path).set("graphdata", {"score": 42.0})
+        assert [p.name for p in tmp_path.iterdir()] == ["graphdata.json"]
+
+    def test_env_overrides(self, monkeypatch, tmp_path):
+        """Test FGI_CACHE_TTL and FGI_CACHE_DIR are honored."""
+        monkeypatch.setenv("FGI_CACHE_TTL", "30")
+        monkeypatch.setenv("FGI_CACHE_DIR", str(tmp_path))
+        assert default_ttl() == 30.0
+        assert default_directory() == tmp_path
+
+
+class _FakeResponse:
+    def __init__(self, status_code, data=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._data = data
+
+    def raise_for_status(self):
+        pass
+
+    @property
+    def content(self):
+        return orjson.dumps(self._data)
+
+
+class TestConditionalFetch:
+    """Tests for conditional requests in scrape_cnn."""
+
+    def test_not_modified_reuses_last_body(self, monkeypatch, tmp_path):
+        """Test a 304 returns the previously parsed payload."""
+        from fear_greed_index import scrape_cnn
+
+        payload = {"fear_and_greed": {"score": 42.0}}
+        responses = [
+            _FakeResponse(200, payload, {"ETag": '"v1"'}),
+            _FakeResponse(304),
+        ]
+        sent_headers = []
+
+        def fake_get(url, headers=None, timeout=None):
+            sent_headers.append(headers)
+            return responses.pop(0)
+
+        monkeypatch.setattr(scrape_cnn, "_file_cache", FileCache(tmp_path))
+        monkeypatch.setattr(scrape_cnn, "_last_response",
+                            {"data": None, "etag": None, "last_modified": None})
+        monkeypatch.setattr(scrape_cnn._session, "get", fake_get)
+
+        first = scrape_cnn._get_fear_greed_data(ttl=0)
+        assert first == payload
+        assert scrape_cnn._get_fear_greed_data(ttl=0) is first
+        assert sent_headers == [{}, {"If-None-Match": '"v1"'}]
@@ -1,10 +1,24 @@
 """Tests for core Fear & Greed Index library."""
 
+import re
+
 import pytest
 from datetime import datetime
-from fear_greed_index import CNNFearAndGreedIndex
+from fear_greed_index import CNNFearAndGreedIndex, scrape_cnn
 from fear_greed_index.FearAndGreedIndicator import FearAndGreedIndicator
 
+_REPORT_RE = re.compile(r"VIX|Neutral|50\.0")
+
+INDICATOR_ATTRS = [
+    "junk_bond_demand",
+    "market_volatility",
+    "put_call_options",
+    "market_momentum",
+    "stock_price_strength",
+    "stock_price_breadth",
+    "safe_haven_demand",
+]
+
 
 class TestFearAndGreedIndicator:
     """Tests for FearAndGreedIndicator class."""
@@ -43,19 +57,12 @@ class TestFearAndGreedIndicator:
         """Test report generation."""
         indicator = FearAndGreedIndicator("VIX", {"score": 50, "rating": "neutral"})
         report = indicator.get_report()
-        assert "VIX" in report
-        assert "Neutral" in report
-        assert "50.0" in report
+        assert set(_REPORT_RE.findall(report)) == {"VIX", "Neutral", "50.0"}
 
 
 class TestCNNFearAndGreedIndex:
     """Tests for CNNFearAndGreedIndex class."""
 
-    @pytest.fixture
-    def fgi(self):
-        """Create FGI instance for tests."""
-        return CNNFearAndGreedIndex()
-
     def test_instantiation(self, fgi):
         """Test that FGI can be instantiated."""
         assert fgi is not None
@@ -80,20 +87,13 @@ class TestCNNFearAndGreedIndex:
         """Test that all 7 indicators are present."""
         assert len(fgi.all_indicators) == 7
 
-    def test_indicator_scores_valid(self, fgi):
-        """Test all indicator scores are in valid range."""
-        for indicator in fgi.all_indicators:
-            assert 0 <= indicator.score <= 100, f"{indicator.name} score out of range"
-
-    def test_specific_indicators_exist(self, fgi):
-        """Test specific indicators are accessible."""
-        assert fgi.junk_bond_demand is not None
-        assert fgi.market_volatility is not None
-        assert fgi.put_call_options is not None
-        assert fgi.market_momentum is not None
-        assert fgi.stock_price_strength is not None
-        assert fgi.stock_price_breadth is not None
-        assert fgi.safe_haven_demand is not None
+    @pytest.mark.parametrize("attr", INDICATOR_ATTRS)
+    def test_indicator(self, fgi, attr):
+        """Test each indicator is accessible, listed and has a score in range."""
+        indicator = getattr(fgi, attr)
+        assert indicator is not None
+        assert indicator in fgi.all_indicators
+        assert 0 <= indicator.score <= 100
 
     def test_historical_data_not_empty(self, fgi):
         """Test historical data is available."""
@@ -108,6 +108,45 @@ class TestCNNFearAndGreedIndex:
             assert "y" in point
             assert "rating" in point
 
+    def test_historical_arrays_match_data(self, fgi):
+        """Test historical columns mirror the list of points and are cached."""
+        x, y, ratings = fgi.get_historical_arrays()
+        historical = fgi.get_historical_data()
+        assert len(x) == len(y) == len(ratings) == len(historical)
+        assert y[-1] == historical[-1]["y"]
+        assert ratings[-1] == historical[-1]["rating"]
+        assert fgi.get_historical_arrays()[0] is x
+        assert not x.flags.writeable
+
+    def test_refresh_reuses_indicators(self, cnn_payload):
+        """Test refresh updates the existing indicator objects in place."""
+        # A private index, so the session-wide one is never refreshed under other tests
+        fgi = CNNFearAndGreedIndex(cnn_payload)
+        indicators = fgi.all_indicators
+        fgi.refresh(ttl=0)
+        assert fgi.all_indicators is indicators
+        assert 0 <= fgi.score <= 100
+
+    def test_refresh_clears_missing_fields(self, cnn_payload, monkeypatch):
+        """Test refresh resets fields the new payload omits to their defaults."""
+        stripped = {key: dict(value) for key, value in cnn_payload.items()}
+        for value in stripped.values():
+            value.pop("timestamp", None)
+        del stripped["market_volatility_vix"]
+        monkeypatch.setattr(scrape_cnn, "_get_fear_greed_data", lambda ttl=None: stripped)
+
+        fgi = CNNFearAndGreedIndex(cnn_payload)
+        assert fgi.timestamp is not None
+        fgi.refresh()
+        fresh = CNNFearAndGreedIndex(stripped)
+
+        assert fgi.timestamp is None
+        for refreshed, built in zip(fgi.all_indicators, fresh.all_indicators):
+            assert (refreshed.score, refreshed.rating, refreshed.timestamp) == (
+                built.score, built.rating, built.timestamp
+            )
+            assert refreshed.timestamp is None
+
     def test_get_score(self, fgi):
         """Test get_score method."""
         assert fgi.get_score() == fgi.score
@@ -116,13 +155,15 @@ class TestCNNFearAndGreedIndex:
         """Test get_rating method."""
         assert fgi.get_rating() == fgi.rating
 
-    def test_get_index_summary(self, fgi):
+    def test_get_index_summary(self, fgi, reports):
         """Test index summary generation."""
-        summary = fgi.get_index_summary()
+        summary = reports.summary
         assert len(summary) > 10
         assert "Fear & Greed" in summary or str(fgi.score) in summary
+        assert reports.complete.startswith(summary)
 
-    def test_get_complete_report(self, fgi):
+    def test_get_complete_report(self, fgi, reports):
         """Test complete report generation."""
-        report = fgi.get_complete_report()
-        assert len(report) > 100
+        assert len(reports.complete) > 100
+        for indicator in fgi.all_indicators:
+            assert indicator.name in reports.complete
@@ -0,0 +1,26 @@
+"""Opt-in checks against the live CNN endpoint.
+
+Deselected by default; run with ``uv run pytest -m network``.
+"""
+
+import pytest
+
+from fear_greed_index import CNNFearAndGreedIndex
+
+pytestmark = pytest.mark.network
+
+
+def test_live_payload_parses():
+    """Test the live API response still loads into a full index."""
+    fgi = CNNFearAndGreedIndex(ttl=0)
+    assert 0 <= fgi.score <= 100
+    assert fgi.timestamp is not None
+    assert len(fgi.all_indicators) == 7
+    assert len(fgi.historical_data) > 0
+
+
+async def test_live_payload_parses_async():
+    """Test the async client fetches the same payload shape."""
+    fgi = await CNNFearAndGreedIndex.create(ttl=0)
+    assert 0 <= fgi.score <= 100
+    assert len(fgi.all_indicators) == 7
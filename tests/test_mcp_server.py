@@ -1,30 +1,59 @@
 """Tests for MCP Server."""
 
-import pytest
 import asyncio
+import re
+
+import pytest
+import fgi_mcp_server
 from fgi_mcp_server import list_tools, call_tool
 
+# Text every tool's response must contain
+TOOL_MARKERS = {
+    "get_fear_greed_score": "Score:",
+    "get_fear_greed_indicators": "Junk Bond",
+    "get_fear_greed_comparison": "Previous Close",
+    "get_trading_signal": "Trading Signal:",
+    "get_fear_greed_history": "History",
+    "get_complete_report": "Fear & Greed Now:",
+}
+
+_COMPARISON_RE = re.compile(r"Previous Close|1 Week Ago")
+_SIGNAL_RE = re.compile(r"STRONG BUY|STRONG SELL|BUY|SELL|HOLD")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def serve_fgi(fgi):
+    """Serve the session's index to every tool call in this module."""
+
+    async def get_fgi_data():
+        return fgi
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(fgi_mcp_server, "get_fgi_data", get_fgi_data)
+        yield
+
+
+@pytest.fixture(scope="module")
+async def tools():
+    """List the server's tools once for this module."""
+    return await list_tools()
+
+
+@pytest.fixture(scope="module")
+async def complete_report(serve_fgi):
+    """Call the get_complete_report tool once for this module."""
+    return await call_tool("get_complete_report", {})
+
 
 class TestMCPServer:
     """Tests for MCP Server tools."""
 
-    @pytest.fixture
-    def event_loop(self):
-        """Create event loop for async tests."""
-        loop = asyncio.new_event_loop()
-        yield loop
-        loop.close()
-
-    @pytest.mark.asyncio
-    async def test_list_tools_count(self):
+    def test_list_tools_count(self, tools):
         """Test that all tools are listed."""
-        tools = await list_tools()
         assert len(tools) == 6
 
-    @pytest.mark.asyncio
-    async def test_list_tools_names(self):
+    def test_list_tools_names(self, tools):
         """Test that expected tools are present."""
-        tools = await list_tools()
         tool_names = [t.name for t in tools]
 
         expected = [
@@ -59,8 +88,7 @@ class TestMCPServer:
         """Test get_fear_greed_comparison tool."""
         result = await call_tool("get_fear_greed_comparison", {})
         assert len(result) == 1
-        assert "Previous Close" in result[0].text
-        assert "1 Week Ago" in result[0].text
+        assert set(_COMPARISON_RE.findall(result[0].text)) == {"Previous Close", "1 Week Ago"}
 
     @pytest.mark.asyncio
     async def test_get_trading_signal(self):
@@ -68,9 +96,7 @@ class TestMCPServer:
         result = await call_tool("get_trading_signal", {})
         assert len(result) == 1
         assert "Trading Signal:" in result[0].text
-
-        valid_signals = ["STRONG BUY", "BUY", "HOLD", "SELL", "STRONG SELL"]
-        assert any(signal in result[0].text for signal in valid_signals)
+        assert _SIGNAL_RE.search(result[0].text)
 
     @pytest.mark.asyncio
     async def test_get_fear_greed_history(self):
@@ -86,12 +112,17 @@ class TestMCPServer:
         assert len(result) == 1
         assert "Last 10 Days" in result[0].text
 
-    @pytest.mark.asyncio
-    async def test_get_complete_report(self):
+    def test_get_complete_report(self, complete_report):
         """Test get_complete_report tool."""
-        result = await call_tool("get_complete_report", {})
-        assert len(result) == 1
-        assert len(result[0].text) > 200
+        assert len(complete_report) == 1
+        assert len(complete_report[0].text) > 200
+
+    @pytest.mark.asyncio
+    async def test_all_tools_concurrent(self):
+        """Test every tool answers when called concurrently."""
+        results = await asyncio.gather(*(call_tool(name, {}) for name in TOOL_MARKERS))
+        for (name, marker), result in zip(TOOL_MARKERS.items(), results):
+            assert marker in result[0].text, name
 
     @pytest.mark.asyncio
     async def test_unknown_tool(self):
@@ -8,18 +8,57 @@ repository features are working properly.
 Run with: uv run pytest tests/test_readme_examples.py -v
 """
 
-import pytest
+import asyncio
 import json
-import os
-import tempfile
+from datetime import datetime
 from io import StringIO
-import sys
+
+import numpy as np
+import pytest
+
+from fear_greed_index import CNNFearAndGreedIndex
+from fgi_cli import cli
+from fgi_mcp_server import call_tool
+
+# Attributes documented in the README API Reference
+_INDEX_ATTRS = frozenset({
+    'score', 'rating', 'previous_close', 'previous_1_week', 'previous_1_month',
+    'previous_1_year', 'timestamp', 'historical_data',
+})
+_INDEX_INDICATOR_ATTRS = frozenset({
+    'junk_bond_demand', 'market_volatility', 'put_call_options', 'market_momentum',
+    'stock_price_strength', 'stock_price_breadth', 'safe_haven_demand', 'all_indicators',
+})
+_INDICATOR_ATTRS = frozenset({'name', 'score', 'rating', 'timestamp', 'historical_data'})
+
+_VALID_RATINGS = frozenset({"extreme fear", "fear", "neutral", "greed", "extreme greed"})
+_VALID_ICONS = frozenset({"🔴", "🟡", "🟢"})
+
+
+def assert_valid_score(value):
+    """Assert a value is a numeric Fear & Greed score in 0-100."""
+    assert isinstance(value, (int, float))
+    assert 0 <= value <= 100
+
+
+def get_trading_signal(score: float) -> str:
+    """Generate trading signal based on Fear & Greed score (README Example 4)."""
+    if score < 20:
+        return "STRONG BUY - Extreme fear, potential opportunity"
+    elif score < 40:
+        return "BUY - Fear in the market"
+    elif score < 60:
+        return "HOLD - Neutral sentiment"
+    elif score < 80:
+        return "SELL - Greed in the market"
+    else:
+        return "STRONG SELL - Extreme greed, potential top"
 
 
 class TestQuickStart:
     """Test Quick Start Python API example from README."""
 
-    def test_quick_start_python_api(self):
+    def test_quick_start_python_api(self, fgi, reports):
         """
         README Quick Start - Python API:
 
@@ -29,30 +68,22 @@ class TestQuickStart:
         print(f"Rating: {fgi.rating}")
         print(fgi.get_complete_report())
         """
-        from fear_greed_index import CNNFearAndGreedIndex
-
-        fgi = CNNFearAndGreedIndex()
-
         # Verify score
-        assert fgi.score is not None
-        assert isinstance(fgi.score, (int, float))
-        assert 0 <= fgi.score <= 100
+        assert_valid_score(fgi.score)
 
         # Verify rating
         assert fgi.rating is not None
-        valid_ratings = ["extreme fear", "fear", "neutral", "greed", "extreme greed"]
-        assert fgi.rating.lower() in valid_ratings
+        assert fgi.rating.lower() in _VALID_RATINGS
 
         # Verify complete report
-        report = fgi.get_complete_report()
-        assert report is not None
-        assert len(report) > 100
+        assert reports.complete is not None
+        assert len(reports.complete) > 100
 
 
 class TestExample1:
     """Test Example 1: Basic Market Sentiment Check."""
 
-    def test_basic_market_sentiment_check(self):
+    def test_basic_market_sentiment_check(self, fgi):
         """
         README Example 1:
 
@@ -63,27 +94,25 @@ class TestExample1:
         print(f"Previous Close: {fgi.previous_close:.1f}")
         print(f"Change: {fgi.score - fgi.previous_close:+.1f}")
         """
-        from fear_greed_index import CNNFearAndGreedIndex
-
-        fgi = CNNFearAndGreedIndex()
-
-        # All these operations should work without error
-        score_str = f"Current Fear & Greed Index: {fgi.score:.1f}"
-        sentiment_str = f"Market Sentiment: {fgi.rating.upper()}"
-        previous_str = f"Previous Close: {fgi.previous_close:.1f}"
-        change = fgi.score - fgi.previous_close
-        change_str = f"Change: {change:+.1f}"
-
-        assert "Fear & Greed Index" in score_str
-        assert fgi.rating.upper() in sentiment_str
+        assert isinstance(fgi.score, (int, float))
+        assert isinstance(fgi.rating, str)
         assert isinstance(fgi.previous_close, (int, float))
-        assert isinstance(change, (int, float))
+        assert isinstance(fgi.score - fgi.previous_close, (int, float))
+
+    def test_smoke_format(self, fgi):
+        """Test the format specs used by the README examples render."""
+        # Values from the recorded payload in tests/fixtures/cnn_payload.json
+        assert f"Current Fear & Greed Index: {fgi.score:.1f}" == "Current Fear & Greed Index: 24.4"
+        assert f"Market Sentiment: {fgi.rating.upper()}" == "Market Sentiment: EXTREME FEAR"
+        assert f"Change: {fgi.score - fgi.previous_close:+.1f}" == "Change: +1.3"
+        assert f"Now:          {fgi.score:.1f} ({fgi.rating})" == "Now:          24.4 (extreme fear)"
+        assert f"VIX Indicator Score: {fgi.market_volatility.score:.1f}" == "VIX Indicator Score: 50.0"
 
 
 class TestExample2:
     """Test Example 2: Compare Current vs Historical Sentiment."""
 
-    def test_compare_current_vs_historical(self):
+    def test_compare_current_vs_historical(self, fgi):
         """
         README Example 2:
 
@@ -97,31 +126,22 @@ class TestExample2:
         print(f"1 Month Ago:  {fgi.previous_1_month:.1f}")
         print(f"1 Year Ago:   {fgi.previous_1_year:.1f}")
         """
-        from fear_greed_index import CNNFearAndGreedIndex
-
-        fgi = CNNFearAndGreedIndex()
-
-        # All historical values should be valid floats
-        assert isinstance(fgi.score, (int, float))
-        assert isinstance(fgi.previous_close, (int, float))
-        assert isinstance(fgi.previous_1_week, (int, float))
-        assert isinstance(fgi.previous_1_month, (int, float))
-        assert isinstance(fgi.previous_1_year, (int, float))
-
-        # All should be in valid range
+        # All historical values should be valid scores
         for value in [fgi.score, fgi.previous_close, fgi.previous_1_week,
                       fgi.previous_1_month, fgi.previous_1_year]:
-            assert 0 <= value <= 100
+            assert_valid_score(value)
 
-        # Format strings should work
-        output = f"Now: {fgi.score:.1f} ({fgi.rating})"
-        assert fgi.rating in output
+        assert isinstance(fgi.rating, str)
 
 
 class TestExample3:
     """Test Example 3: Analyze Individual Indicators."""
 
-    def test_analyze_individual_indicators(self):
+    # README status ladder: red below 25, yellow below 50, green otherwise
+    STATUS_BOUNDS = np.array([25.0, 50.0])
+    STATUS_ICONS = np.array(["🔴", "🟡", "🟢"])
+
+    def test_analyze_individual_indicators(self, fgi):
         """
         README Example 3:
 
@@ -133,36 +153,45 @@ class TestExample3:
             status = "🔴" if indicator.score < 25 else "🟡" if indicator.score < 50 else "🟢"
             print(f"{status} {indicator.name}: {indicator.score:.1f} ({indicator.rating})")
         """
-        from fear_greed_index import CNNFearAndGreedIndex
-
-        fgi = CNNFearAndGreedIndex()
-
         # Should have exactly 7 indicators
         assert len(fgi.all_indicators) == 7
 
-        for indicator in fgi.all_indicators:
-            # Each indicator should have required attributes
-            assert hasattr(indicator, 'name')
-            assert hasattr(indicator, 'score')
-            assert hasattr(indicator, 'rating')
+        # Bucket every score at once; side="right" matches the README's `score < 25`
+        scores = np.fromiter((i.score for i in fgi.all_indicators), dtype=np.float64, count=7)
+        statuses = self.STATUS_ICONS[np.searchsorted(self.STATUS_BOUNDS, scores, side="right")]
+        assert statuses.tolist() == [
+            "🔴" if score < 25 else "🟡" if score < 50 else "🟢" for score in scores.tolist()
+        ]
 
-            # Score should be valid
-            assert isinstance(indicator.score, (int, float))
-            assert 0 <= indicator.score <= 100
+    @pytest.fixture
+    def indicator(self, fgi, request):
+        """Indicator at the parametrized position of ``fgi.all_indicators``."""
+        return fgi.all_indicators[request.param]
 
-            # Status logic should work
-            status = "🔴" if indicator.score < 25 else "🟡" if indicator.score < 50 else "🟢"
-            assert status in ["🔴", "🟡", "🟢"]
+    @pytest.mark.parametrize("indicator", range(7), indirect=True)
+    def test_indicator_status(self, indicator):
+        """Test the Example 3 loop body for each indicator."""
+        # Each indicator should have required attributes
+        assert hasattr(indicator, 'name')
+        assert hasattr(indicator, 'score')
+        assert hasattr(indicator, 'rating')
+
+        # Score should be valid
+        assert_valid_score(indicator.score)
+
+        # Status logic should work
+        status = "🔴" if indicator.score < 25 else "🟡" if indicator.score < 50 else "🟢"
+        assert status in _VALID_ICONS
 
-            # Format string should work
-            output = f"{status} {indicator.name}: {indicator.score:.1f} ({indicator.rating})"
-            assert indicator.name in output
+        # Format string should work
+        output = f"{status} {indicator.name}: {indicator.score:.1f} ({indicator.rating})"
+        assert indicator.name in output
 
 
 class TestExample4:
     """Test Example 4: Trading Signal Based on Sentiment."""
 
-    def test_trading_signal_based_on_sentiment(self):
+    def test_trading_signal_based_on_sentiment(self, fgi):
         """
         README Example 4:
 
@@ -178,22 +207,6 @@ class TestExample4:
             else:
                 return "STRONG SELL - Extreme greed, potential top"
         """
-        from fear_greed_index import CNNFearAndGreedIndex
-
-        def get_trading_signal(score: float) -> str:
-            """Generate trading signal based on Fear & Greed score."""
-            if score < 20:
-                return "STRONG BUY - Extreme fear, potential opportunity"
-            elif score < 40:
-                return "BUY - Fear in the market"
-            elif score < 60:
-                return "HOLD - Neutral sentiment"
-            elif score < 80:
-                return "SELL - Greed in the market"
-            else:
-                return "STRONG SELL - Extreme greed, potential top"
-
-        fgi = CNNFearAndGreedIndex()
         signal = get_trading_signal(fgi.score)
 
         # Signal should be one of the expected values
@@ -206,18 +219,22 @@ class TestExample4:
         ]
         assert signal in valid_signals
 
-        # Test all score ranges
-        assert "STRONG BUY" in get_trading_signal(10)
-        assert "BUY" in get_trading_signal(30)
-        assert "HOLD" in get_trading_signal(50)
-        assert "SELL" in get_trading_signal(70)
-        assert "STRONG SELL" in get_trading_signal(90)
+    @pytest.mark.parametrize("score,expected", [
+        (10, "STRONG BUY"),
+        (30, "BUY"),
+        (50, "HOLD"),
+        (70, "SELL"),
+        (90, "STRONG SELL"),
+    ])
+    def test_signal_ranges(self, score, expected):
+        """Test each score range maps to its signal."""
+        assert get_trading_signal(score).startswith(f"{expected} - ")
 
 
 class TestExample5:
     """Test Example 5: Historical Data Analysis with Pandas."""
 
-    def test_historical_data_analysis_with_pandas(self):
+    def test_historical_data_analysis_with_pandas(self, historical_df):
         """
         README Example 5:
 
@@ -240,31 +257,14 @@ class TestExample5:
         print("\\nSentiment Distribution:")
         print(df['rating'].value_counts())
         """
-        from fear_greed_index import CNNFearAndGreedIndex
-        from datetime import datetime
-        import pandas as pd
-
-        fgi = CNNFearAndGreedIndex()
-
-        # Get historical data
-        historical = fgi.get_historical_data()
-        assert len(historical) > 0
-
-        # Convert to DataFrame
-        df = pd.DataFrame(historical)
-        assert 'x' in df.columns
-        assert 'y' in df.columns
-        assert 'rating' in df.columns
-
-        # Date conversion
-        df['date'] = pd.to_datetime(df['x'], unit='ms')
-        df = df.rename(columns={'y': 'score'})
-        df = df[['date', 'score', 'rating']]
+        pd = pytest.importorskip("pandas")
+        df = historical_df
+        assert list(df.columns) == ['date', 'score', 'rating']
+        assert pd.api.types.is_datetime64_any_dtype(df['date'])
 
         # Verify data
         assert len(df) > 200  # Should have ~1 year of data
-        assert df['score'].min() >= 0
-        assert df['score'].max() <= 100
+        assert df['score'].between(0, 100).all()
 
         # Statistics should work
         avg_score = df['score'].mean()
@@ -282,7 +282,7 @@ class TestExample5:
 class TestExample6:
     """Test Example 6: Detect Sentiment Extremes."""
 
-    def test_detect_sentiment_extremes(self):
+    def test_detect_sentiment_extremes(self, fgi, historical_df):
         """
         README Example 6:
 
@@ -301,10 +301,6 @@ class TestExample6:
         for date, score in extreme_fear_days[-5:]:
             print(f"  {date}: {score:.1f}")
         """
-        from fear_greed_index import CNNFearAndGreedIndex
-        from datetime import datetime
-
-        fgi = CNNFearAndGreedIndex()
         historical = fgi.get_historical_data()
 
         # Find extreme fear days
@@ -315,18 +311,19 @@ class TestExample6:
 
         # Should be a list (may be empty if no extreme fear days)
         assert isinstance(extreme_fear_days, list)
+        assert len(extreme_fear_days) == (historical_df['score'] < 20).sum()
 
         # If there are extreme fear days, verify format
-        for date, score in extreme_fear_days:
-            assert len(date) == 10  # YYYY-MM-DD format
-            assert isinstance(score, (int, float))
-            assert score < 20
+        dates = np.array([date for date, _ in extreme_fear_days], dtype=str)
+        scores = np.array([score for _, score in extreme_fear_days], dtype=float)
+        assert (np.char.str_len(dates) == 10).all()  # YYYY-MM-DD format
+        assert (scores < 20).all()
 
 
 class TestExample7:
     """Test Example 7: VIX-Specific Analysis."""
 
-    def test_vix_specific_analysis(self):
+    def test_vix_specific_analysis(self, fgi):
         """
         README Example 7:
 
@@ -343,10 +340,6 @@ class TestExample7:
         elif vix.score > 70:
             print("✅ Low volatility - VIX indicating complacency")
         """
-        from fear_greed_index import CNNFearAndGreedIndex
-
-        fgi = CNNFearAndGreedIndex()
-
         # VIX indicator should exist
         vix = fgi.market_volatility
         assert vix is not None
@@ -357,15 +350,9 @@ class TestExample7:
         assert hasattr(vix, 'timestamp')
 
         # Score should be valid
-        assert isinstance(vix.score, (int, float))
-        assert 0 <= vix.score <= 100
-
-        # Format strings should work
-        score_str = f"VIX Indicator Score: {vix.score:.1f}"
-        rating_str = f"VIX Sentiment: {vix.rating}"
+        assert_valid_score(vix.score)
 
-        assert "VIX" in score_str
-        assert vix.rating in rating_str
+        assert isinstance(vix.rating, str)
 
         # Timestamp formatting (may be None)
         if vix.timestamp:
@@ -376,7 +363,7 @@ class TestExample7:
 class TestExample8:
     """Test Example 8: Export Data to JSON."""
 
-    def test_export_data_to_json(self):
+    def test_export_data_to_json(self, fgi):
         """
         README Example 8:
 
@@ -404,13 +391,6 @@ class TestExample8:
         with open("fear_greed_data.json", "w") as f:
             json.dump(data, f, indent=2)
         """
-        from fear_greed_index import CNNFearAndGreedIndex
-        import json
-        import tempfile
-        import os
-
-        fgi = CNNFearAndGreedIndex()
-
         # Build data structure
         data = {
             "timestamp": fgi.timestamp.isoformat() if fgi.timestamp else None,
@@ -436,45 +416,23 @@ class TestExample8:
         assert parsed["rating"] == fgi.rating
         assert len(parsed["indicators"]) == 7
 
-        # File writing should work
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(data, f, indent=2)
-            temp_path = f.name
-
-        # Verify file was written
-        assert os.path.exists(temp_path)
-        with open(temp_path, 'r') as f:
-            file_data = json.load(f)
+        # Writing to a file object should work
+        buffer = StringIO()
+        json.dump(data, buffer, indent=2)
+        buffer.seek(0)
+        file_data = json.load(buffer)
         assert file_data["score"] == fgi.score
 
-        # Cleanup
-        os.unlink(temp_path)
-
 
 class TestExample9FastAPI:
     """Test Example 9: FastAPI Service (module import and structure)."""
 
     def test_fastapi_module_loads(self):
-        """Verify the api_server.py module loads without errors."""
-        import importlib.util
-        import os
-
-        api_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            'api_server.py'
-        )
-
-        if os.path.exists(api_path):
-            spec = importlib.util.spec_from_file_location("api_server", api_path)
-            module = importlib.util.module_from_spec(spec)
-            # Just verify it can be loaded - don't execute
-            assert spec is not None
+        """Verify the api_server.py module imports without errors."""
+        pytest.importorskip("api_server")
 
     def test_fastapi_cache_function(self):
         """Test the cache function logic from Example 9."""
-        from datetime import datetime
-        from fear_greed_index import CNNFearAndGreedIndex
-
         # Replicate the cache logic from README
         _cache = {"data": None, "timestamp": None}
 
@@ -499,125 +457,83 @@ class TestExample9FastAPI:
         assert fgi2 is fgi1  # Same object (cached)
 
 
+@pytest.mark.usefixtures("cli_fgi")
 class TestCLICommands:
     """Test CLI commands mentioned in README."""
 
-    def test_cli_score_command(self):
-        """Test: uv run fgi score"""
-        from click.testing import CliRunner
-        from fgi_cli import cli
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ['score'])
+    @pytest.mark.parametrize("argv,needles", [
+        (['score'], ()),
+        (['signal'], ("TRADING SIGNAL",)),
+        (['json'], ("score", "rating")),
+        (['history', '--limit', '5'], ("Historical Data",)),
+        (['dashboard'], ("FEAR & GREED",)),
+        (['indicators'], ()),
+    ], ids=["score", "signal", "json", "history", "dashboard", "indicators"])
+    def test_cli_command(self, cli_runner, argv, needles):
+        """Test: uv run fgi <argv>"""
+        result = cli_runner.invoke(cli, argv)
         assert result.exit_code == 0
-        # Should contain score and rating
+        for needle in needles:
+            assert needle in result.output
 
-    def test_cli_signal_command(self):
-        """Test: uv run fgi signal"""
-        from click.testing import CliRunner
-        from fgi_cli import cli
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ['signal'])
-        assert result.exit_code == 0
-        assert "TRADING SIGNAL" in result.output
+# Arguments for each MCP tool shown in the README
+_MCP_TOOL_ARGS = {
+    "get_fear_greed_score": {},
+    "get_trading_signal": {},
+    "get_fear_greed_indicators": {},
+    "get_fear_greed_comparison": {},
+    "get_fear_greed_history": {"days": 5},
+    "get_complete_report": {},
+}
 
-    def test_cli_json_command(self):
-        """Test: uv run fgi json"""
-        from click.testing import CliRunner
-        from fgi_cli import cli
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ['json'])
-        assert result.exit_code == 0
-        assert "score" in result.output
-        assert "rating" in result.output
-
-    def test_cli_history_command(self):
-        """Test: uv run fgi history --limit 5"""
-        from click.testing import CliRunner
-        from fgi_cli import cli
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ['history', '--limit', '5'])
-        assert result.exit_code == 0
-        assert "Historical Data" in result.output
-
-    def test_cli_dashboard_command(self):
-        """Test: uv run fgi dashboard"""
-        from click.testing import CliRunner
-        from fgi_cli import cli
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ['dashboard'])
-        assert result.exit_code == 0
-        assert "FEAR & GREED" in result.output
-
-    def test_cli_indicators_command(self):
-        """Test: uv run fgi indicators"""
-        from click.testing import CliRunner
-        from fgi_cli import cli
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ['indicators'])
-        assert result.exit_code == 0
+@pytest.fixture(scope="module")
+async def mcp_results():
+    """Call every README MCP tool concurrently, once for this module."""
+    results = await asyncio.gather(
+        *(call_tool(name, args) for name, args in _MCP_TOOL_ARGS.items())
+    )
+    return dict(zip(_MCP_TOOL_ARGS, results))
 
 
 class TestMCPServer:
     """Test MCP Server functionality mentioned in README."""
 
-    @pytest.mark.asyncio
-    async def test_mcp_get_fear_greed_score(self):
+    def test_mcp_get_fear_greed_score(self, mcp_results):
         """Test MCP tool: get_fear_greed_score"""
-        from fgi_mcp_server import call_tool
-
-        result = await call_tool("get_fear_greed_score", {})
+        result = mcp_results["get_fear_greed_score"]
         assert len(result) == 1
         assert "Score:" in result[0].text
         assert "Rating:" in result[0].text
 
-    @pytest.mark.asyncio
-    async def test_mcp_get_trading_signal(self):
+    def test_mcp_get_trading_signal(self, mcp_results):
         """Test MCP tool: get_trading_signal"""
-        from fgi_mcp_server import call_tool
-
-        result = await call_tool("get_trading_signal", {})
+        result = mcp_results["get_trading_signal"]
         assert len(result) == 1
         assert "Trading Signal:" in result[0].text
 
-    @pytest.mark.asyncio
-    async def test_mcp_get_fear_greed_indicators(self):
+    def test_mcp_get_fear_greed_indicators(self, mcp_results):
         """Test MCP tool: get_fear_greed_indicators"""
-        from fgi_mcp_server import call_tool
-
-        result = await call_tool("get_fear_greed_indicators", {})
+        result = mcp_results["get_fear_greed_indicators"]
         assert len(result) == 1
         assert "Junk Bond" in result[0].text
 
-    @pytest.mark.asyncio
-    async def test_mcp_get_fear_greed_comparison(self):
+    def test_mcp_get_fear_greed_comparison(self, mcp_results):
         """Test MCP tool: get_fear_greed_comparison"""
-        from fgi_mcp_server import call_tool
-
-        result = await call_tool("get_fear_greed_comparison", {})
+        result = mcp_results["get_fear_greed_comparison"]
         assert len(result) == 1
         assert "Previous Close" in result[0].text
 
-    @pytest.mark.asyncio
-    async def test_mcp_get_fear_greed_history(self):
+    def test_mcp_get_fear_greed_history(self, mcp_results):
         """Test MCP tool: get_fear_greed_history"""
-        from fgi_mcp_server import call_tool
-
-        result = await call_tool("get_fear_greed_history", {"days": 5})
+        result = mcp_results["get_fear_greed_history"]
         assert len(result) == 1
         assert "History" in result[0].text
 
-    @pytest.mark.asyncio
-    async def test_mcp_get_complete_report(self):
+    def test_mcp_get_complete_report(self, mcp_results):
         """Test MCP tool: get_complete_report"""
-        from fgi_mcp_server import call_tool
-
-        result = await call_tool("get_complete_report", {})
+        result = mcp_results["get_complete_report"]
         assert len(result) == 1
         assert len(result[0].text) > 200
 
@@ -625,75 +541,34 @@ class TestMCPServer:
 class TestAPIReference:
     """Test API Reference examples from README."""
 
-    def test_cnn_fear_greed_index_attributes(self):
+    def test_cnn_fear_greed_index_attributes(self, fgi):
         """Test all documented attributes exist and work."""
-        from fear_greed_index import CNNFearAndGreedIndex
-
-        fgi = CNNFearAndGreedIndex()
+        assert not (_INDEX_ATTRS | _INDEX_INDICATOR_ATTRS).difference(dir(fgi))
 
-        # Main attributes
-        assert hasattr(fgi, 'score')
-        assert hasattr(fgi, 'rating')
-        assert hasattr(fgi, 'previous_close')
-        assert hasattr(fgi, 'previous_1_week')
-        assert hasattr(fgi, 'previous_1_month')
-        assert hasattr(fgi, 'previous_1_year')
-        assert hasattr(fgi, 'timestamp')
-        assert hasattr(fgi, 'historical_data')
-
-        # Indicator attributes
-        assert hasattr(fgi, 'junk_bond_demand')
-        assert hasattr(fgi, 'market_volatility')
-        assert hasattr(fgi, 'put_call_options')
-        assert hasattr(fgi, 'market_momentum')
-        assert hasattr(fgi, 'stock_price_strength')
-        assert hasattr(fgi, 'stock_price_breadth')
-        assert hasattr(fgi, 'safe_haven_demand')
-        assert hasattr(fgi, 'all_indicators')
-
-    def test_cnn_fear_greed_index_methods(self):
+    def test_cnn_fear_greed_index_methods(self, fgi, reports):
         """Test all documented methods exist and work."""
-        from fear_greed_index import CNNFearAndGreedIndex
-
-        fgi = CNNFearAndGreedIndex()
-
         # Test methods
         assert fgi.get_score() == fgi.score
         assert fgi.get_rating() == fgi.rating
 
-        summary = fgi.get_index_summary()
-        assert isinstance(summary, str)
-        assert len(summary) > 0
+        assert isinstance(reports.summary, str)
+        assert len(reports.summary) > 0
 
-        indicators_report = fgi.get_indicators_report()
-        assert isinstance(indicators_report, str)
+        assert isinstance(reports.indicators, str)
 
-        complete_report = fgi.get_complete_report()
-        assert isinstance(complete_report, str)
-        assert len(complete_report) > len(summary)
+        assert isinstance(reports.complete, str)
+        assert len(reports.complete) > len(reports.summary)
 
-        historical = fgi.get_historical_data()
-        assert isinstance(historical, list)
-        assert len(historical) > 0
+        assert isinstance(reports.historical, list)
+        assert len(reports.historical) > 0
 
-    def test_fear_and_greed_indicator_attributes(self):
+    def test_fear_and_greed_indicator_attributes(self, fgi):
         """Test FearAndGreedIndicator attributes."""
-        from fear_greed_index import CNNFearAndGreedIndex
-
-        fgi = CNNFearAndGreedIndex()
         indicator = fgi.all_indicators[0]
+        assert not _INDICATOR_ATTRS.difference(dir(indicator))
 
-        assert hasattr(indicator, 'name')
-        assert hasattr(indicator, 'score')
-        assert hasattr(indicator, 'rating')
-        assert hasattr(indicator, 'timestamp')
-        assert hasattr(indicator, 'historical_data')
-
-    def test_fear_and_greed_indicator_methods(self):
+    def test_fear_and_greed_indicator_methods(self, fgi):
         """Test FearAndGreedIndicator methods."""
-        from fear_greed_index import CNNFearAndGreedIndex
-
-        fgi = CNNFearAndGreedIndex()
         indicator = fgi.all_indicators[0]
 
         assert indicator.get_score() == indicator.score
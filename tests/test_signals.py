@@ -0,0 +1,29 @@
+"""Tests for trading signal classification."""
+
+import pytest
+
+from fear_greed_index.signals import SIGNAL_TABLE, classify_signal
+
+
+class TestClassifySignal:
+    """Tests for classify_signal."""
+
+    @pytest.mark.parametrize("score,expected", [
+        (0, "STRONG BUY"),
+        (19.9, "STRONG BUY"),
+        (20, "BUY"),
+        (39.9, "BUY"),
+        (40, "HOLD"),
+        (59.9, "HOLD"),
+        (60, "SELL"),
+        (79.9, "SELL"),
+        (80, "STRONG SELL"),
+        (100, "STRONG SELL"),
+    ])
+    def test_band_boundaries(self, score, expected):
+        """Test each band starts at its threshold."""
+        assert classify_signal(score).name == expected
+
+    def test_table_covers_every_band(self):
+        """Test there is one signal per band."""
+        assert [s.name for s in SIGNAL_TABLE] == ["STRONG BUY", "BUY", "HOLD", "SELL", "STRONG SELL"]
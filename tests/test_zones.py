@@ -0,0 +1,33 @@
+"""Tests for sentiment zone lookup."""
+
+import numpy as np
+import pytest
+
+from fear_greed_index.zones import zone_index, zone_indices
+
+
+class TestZoneIndex:
+    """Tests for zone_index and zone_indices."""
+
+    @pytest.mark.parametrize("score,expected", [
+        (-5, 0),
+        (0, 0),
+        (24.9, 0),
+        (25, 1),
+        (44.9, 1),
+        (45, 2),
+        (54.9, 2),
+        (55, 3),
+        (74.9, 3),
+        (75, 4),
+        (100, 4),
+        (105, 4),
+    ])
+    def test_zone_boundaries(self, score, expected):
+        """Test each zone starts at its threshold and out-of-range scores clamp."""
+        assert zone_index(score) == expected
+
+    def test_vectorized_matches_scalar(self):
+        """Test zone_indices agrees with zone_index for every score."""
+        scores = np.linspace(-10, 110, 1201)
+        assert zone_indices(scores).tolist() == [zone_index(s) for s in scores.tolist()]